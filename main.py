@@ -2,25 +2,53 @@
 Application entry point for Writing Assistant Pro (Flet version)
 """
 
-import multiprocessing
-
-import flet as ft
+import importlib
+import sys
+import threading
 
 from src.core import (
     parse_arguments,
     setup_exception_handler,
     setup_root_logger,
 )
-from src.ui import WritingAssistantFletApp
 from src.version import __version__
 
-# Required for PyInstaller
-multiprocessing.freeze_support()
+# Required for PyInstaller (a no-op when not frozen, so skip the import)
+if getattr(sys, "frozen", False):
+    import multiprocessing
+
+    multiprocessing.freeze_support()
+
+# Heavy modules imported in the background while the app bootstraps
+PRELOAD_MODULES = ("flet", "src.ui")
+
+
+def preload_modules() -> None:
+    """Import heavy modules so the main thread finds them in sys.modules"""
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # The main thread import will raise the real error
+            return
+
+
+def close_splash_screen() -> None:
+    """Close the PyInstaller splash screen (only bundled in dev builds)"""
+    try:
+        import pyi_splash  # type: ignore[import-not-found]
+    except ImportError:
+        return
+    pyi_splash.close()
 
 
 def main():
     """Main entry point"""
+    # Overlap the Flet/UI import cost with argument parsing and logger setup
+    threading.Thread(target=preload_modules, daemon=True).start()
+
     # Parse arguments (useful for debug flags)
+    # Done before the heavy UI imports so --help answers immediately
     args = parse_arguments()
 
     # Setup logging BEFORE creating the app (important for PyInstaller)
@@ -31,12 +59,23 @@ def main():
     # Setup exception handler to log crashes to dedicated files
     setup_exception_handler()
 
+    # Heavy imports (Flet and the UI layer) are deferred until they are needed
+    # (already in progress in the preload thread, the import lock waits for it)
+    import flet as ft
+
+    from src.ui import WritingAssistantFletApp
+
     # Create app instance, passing debug mode and version
     app = WritingAssistantFletApp(debug=debug_mode, version=__version__)
 
+    # Imports are done, hand over from the splash screen to the app
+    close_splash_screen()
+
     # Run Flet app
-    # native=True is default for desktop
-    ft.app(target=app.main)
+    # native=True is default for desktop. A hidden start creates the window
+    # hidden instead of hiding it once the page is built
+    view = ft.AppView.FLET_APP_HIDDEN if app.config.WINDOW_START_HIDDEN else ft.AppView.FLET_APP
+    ft.app(target=app.main, view=view)
 
 
 if __name__ in {"__main__", "__mp_main__"}:
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Writing Assistant Pro - Console Utilities
+Console setup shared by all development scripts
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# The UTF-8 console setup is shared with the application (src/core/utils)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+from src.core.utils.console import fix_console_encoding  # noqa: E402
+
+__all__ = ["fix_console_encoding", "supports_ansi"]
+
+# SetConsoleMode flag enabling ANSI escape sequences (Windows 10+)
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+
+@lru_cache(maxsize=1)
+def supports_ansi() -> bool:
+    """
+    Check (once) whether stdout is a terminal that understands ANSI escapes.
+    On Windows, virtual terminal processing is enabled on the console first.
+    """
+    if not sys.stdout.isatty():
+        return False
+    if os.name != "nt":
+        return True
+
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = wintypes.DWORD()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+    return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
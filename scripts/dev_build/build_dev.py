@@ -6,39 +6,42 @@ Cross-platform development build with environment setup
 
 import argparse
 import os
-import shutil
 import subprocess
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Fix for Windows console encoding (emojis)
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
-
 # Import utilities
 from build_utils import (
-    PYINSTALLER_EXCLUSIONS,
+    DEV_APP_SCRIPT_NAMES,
+    IS_WINDOWS,
     BuildTimer,
     check_data,
     clear_console,
     copy_required_files,
+    discard_directory,
+    ensure_cwd_at_project_root,
     ensure_icon_exists,
+    fix_console_encoding,
+    get_build_icon,
     get_executable_name,
     get_project_root,
+    move_same_fs,
+    run_pyinstaller,
+    sweep_discarded_directories,
     terminate_existing_processes,
+    wait_for_discarded_directories,
 )
 
+# Fix for Windows console encoding (emojis)
+fix_console_encoding()
+
 # ===== GLOBAL CONFIGURATION =====
-DEFAULT_SCRIPT_NAME = "main.py"
 MODE = "build-dev"
 CONSOLE_MODE_DEFAULT = True  # True = console visible by default
+LAUNCH_PROBE_TIMEOUT = 0.5  # Seconds to watch for an immediate crash after launch
+PARALLEL_MOVE_THRESHOLD = 8  # Below this many entries, moves stay sequential
+DEV_SPEC_FILE = Path(__file__).parent / "writing_assistant_pro_dev.spec"
 
 
 def copy_required_files_dev() -> bool:
@@ -55,128 +58,140 @@ def clean_dev_cache() -> None:
     for directory in directories_to_clean:
         if directory.exists():
             try:
-                shutil.rmtree(directory)
+                discard_directory(directory)
                 print(f"   Cleaned: {directory}")
             except Exception as e:
                 print(f"   Warning: Could not clean {directory}: {e}")
 
-    # Clean .spec files
-    current_dir = Path(".")
-    for file in current_dir.glob("*.spec"):
-        try:
-            file.unlink()
-            print(f"   Cleaned: {file}")
-        except Exception as e:
-            print(f"   Warning: Could not clean {file}: {e}")
+    # Clean .spec files (single directory scan)
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if not entry.name.endswith(".spec") or not entry.is_file():
+                continue
+            try:
+                os.unlink(entry.path)
+                print(f"   Cleaned: {entry.name}")
+            except Exception as e:
+                print(f"   Warning: Could not clean {entry.name}: {e}")
 
     print("   Cache cleanup completed!")
 
 
-def should_auto_clean() -> bool:
-    """
-    Detect if we should automatically clean cache based on Git state or build artifacts age.
-    This helps avoid slow builds after Git operations without always cleaning.
+def _move_build_item(
+    name: str, source_dir: Path, target_dir: Path, replaced_is_dir: bool | None
+) -> None:
     """
-    try:
-        # Check if .git exists (we're in a Git repo)
-        git_dir = Path(".git")
-        if not git_dir.exists():
-            return False
+    Move one build output entry into target_dir, replacing the previous one.
 
-        # Get last commit time
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ct"], capture_output=True, text=True, timeout=5
-        )
-
-        if result.returncode != 0:
-            return False
+    replaced_is_dir is None when target_dir has no entry with that name,
+    otherwise whether the existing entry is a directory.
+    """
+    target_path = target_dir / name
 
-        last_commit_time = int(result.stdout.strip())
+    # Remove if already exists (directories are deleted in the background)
+    if replaced_is_dir:
+        discard_directory(target_path)
+    elif replaced_is_dir is not None:
+        target_path.unlink()
 
-        # Check if build directory exists and get its modification time
-        build_dir = Path("build")
-        if not build_dir.exists():
-            return False  # No cache to clean
+    # Same filesystem by construction: a rename, no data is copied
+    move_same_fs(source_dir / name, target_path)
 
-        build_time = build_dir.stat().st_mtime
 
-        # If there's a significant time difference (in either direction) between
-        # last commit and build cache, suggest cleaning
-        # This catches: reverts, checkouts, merges, rebases
-        time_diff = abs(last_commit_time - build_time)
-        if time_diff > 600:  # 10 minutes buffer
-            return True
+def flatten_build_output(source_dir: Path, target_dir: Path) -> None:
+    """Move the PyInstaller output folder content up into target_dir."""
+    # One scan per directory (entry types come with the listing, no extra stat)
+    with os.scandir(target_dir) as entries:
+        existing = {entry.name: entry.is_dir(follow_symlinks=False) for entry in entries}
+    with os.scandir(source_dir) as entries:
+        names = [entry.name for entry in entries]
 
-    except Exception:
-        # If anything fails, don't auto-clean
-        pass
+    def move(name: str) -> None:
+        _move_build_item(name, source_dir, target_dir, existing.get(name))
 
-    return False
+    if len(names) < PARALLEL_MOVE_THRESHOLD:
+        for name in names:
+            move(name)
+    else:
+        # Many small entries: overlap the per-file filesystem latency
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            list(executor.map(move, names))
 
+    source_dir.rmdir()
 
-def run_dev_build(console_mode: bool = False, clean_build: bool = False) -> tuple[bool, bool]:
-    """Run PyInstaller build for development"""
 
-    # Auto-detect if we should clean based on Git state
-    auto_clean = should_auto_clean()
-    if auto_clean:
-        print(
-            "⚠️  Detected recent Git operations - "
-            "automatically cleaning cache for optimal build time"
-        )
-        clean_dev_cache()
-        print()
-    elif clean_build:
-        print("🧹  Manual clean build requested")
-        clean_dev_cache()
-        print()
-
-    # Build icon path
-    icon_path = ensure_icon_exists()
-    if not icon_path:
-        print("Error: Icon file not found and could not be generated.")
-        return False, False
+def get_pyinstaller_command(
+    icon_path: Path, console_mode: bool = False, clean_build: bool = False
+) -> list[str]:
+    """
+    Build the PyInstaller command line for the development build.
 
-    # Build PyInstaller command with exclusions - use UV
+    The checked-in spec (DEV_SPEC_FILE) is reused instead of regenerating one
+    from flags on every run; per-build options are passed after "--".
+    The build/ work directory is reused between runs (incremental rebuilds);
+    --clean is only passed when a clean build is explicitly requested.
+    """
+    # Build PyInstaller command from the spec - use UV
     pyinstaller_command = [
         "uv",
         "run",
         "-m",
         "PyInstaller",
-        "--onedir",
-        "--console" if console_mode else "--windowed",
-        f"--icon={icon_path}",
-        "--name=Writing Assistant Pro",
         "--distpath=dist/dev",  # Output to dist/dev/
         "--noconfirm",
-        "--collect-all",
-        "flet",  # Flet assets
     ]
 
-    if clean_build or auto_clean:
+    if clean_build:
         pyinstaller_command.append("--clean")
 
-    # Add exclusions
-    for module in PYINSTALLER_EXCLUSIONS:
-        pyinstaller_command.extend(["--exclude-module", module])
+    # Spec file, followed by the options it parses itself
+    pyinstaller_command.extend(
+        [
+            str(DEV_SPEC_FILE),
+            "--",
+            "--console" if console_mode else "--windowed",
+            f"--icon={get_build_icon(icon_path)}",
+        ]
+    )
+
+    # Splash screen shown by the bootloader while Flet and the UI are imported
+    # (not supported by PyInstaller on macOS)
+    if sys.platform != "darwin":
+        pyinstaller_command.append(f"--splash={icon_path}")
 
-    # Add main script
-    pyinstaller_command.append(f"{DEFAULT_SCRIPT_NAME}")
+    return pyinstaller_command
+
+
+def run_dev_build(console_mode: bool = False, clean_build: bool = False) -> bool:
+    """Run PyInstaller build for development"""
+    if clean_build:
+        print("🧹  Manual clean build requested")
+        clean_dev_cache()
+        ensure_icon_exists.cache_clear()
+        print()
+
+    # Build icon path
+    icon_path = ensure_icon_exists()
+    if not icon_path:
+        print("Error: Icon file not found and could not be generated.")
+        return False
+
+    pyinstaller_command = get_pyinstaller_command(icon_path, console_mode, clean_build)
 
     try:
         mode_text = "console" if console_mode else "windowed"
-        clean_text = " (auto-clean)" if auto_clean else " (clean)" if clean_build else ""
+        clean_text = " (clean)" if clean_build else ""
         print(f"Starting PyInstaller development build ({mode_text} mode{clean_text})...")
-        subprocess.run(pyinstaller_command, check=True)
+        run_pyinstaller(pyinstaller_command)
         print(f"PyInstaller development build completed successfully ({mode_text} mode)!")
-        return True, auto_clean
+        return True
 
     except subprocess.CalledProcessError as e:
         print(f"Error: Build failed with error: {e}")
-        return False, False
+        return False
     except FileNotFoundError:
         print("Error: PyInstaller not found. Please install it with: uv add --dev pyinstaller")
-        return False, False
+        return False
 
 
 def launch_build(extra_args: list[str] | None = None, console_mode: bool = False) -> bool:
@@ -199,6 +214,14 @@ def launch_build(extra_args: list[str] | None = None, console_mode: bool = False
     print(f"Launching {exe_path} with args: {' '.join(extra_args) if extra_args else 'none'}...")
     try:
         if console_mode:
+            if not IS_WINDOWS:
+                # Replace the build script with the application: stdout stays
+                # attached and the build interpreter's memory is released
+                print("ℹ️  Log file: logs/build_dev.log")
+                wait_for_discarded_directories()
+                sys.stdout.flush()
+                os.execv(cmd[0], cmd)
+
             # Blocking call for console mode to keep stdout attached
             print("ℹ️  Console mode: Waiting for application to exit...")
             subprocess.run(cmd)
@@ -207,23 +230,23 @@ def launch_build(extra_args: list[str] | None = None, console_mode: bool = False
             return True
         else:
             # Non-blocking call for windowed mode
-            if sys.platform.startswith("win"):
+            if IS_WINDOWS:
                 process = subprocess.Popen(cmd, shell=False)
             else:
                 process = subprocess.Popen(cmd)
 
-            # Wait briefly to ensure the process starts
-            time.sleep(1)
-
-            # Check if process is still running
-            if process.poll() is None:
+            # Watch the process briefly: an early exit is reported as soon as it
+            # happens, a running process is only waited on for the probe window
+            try:
+                returncode = process.wait(timeout=LAUNCH_PROBE_TIMEOUT)
+            except subprocess.TimeoutExpired:
                 print(f"✓ Application launched successfully (PID: {process.pid})")
                 print("ℹ️  Log file: logs/build_dev.log")
                 return True
-            else:
-                print(f"❌ Application exited immediately with code: {process.returncode}")
-                print("ℹ️  Check log file: logs/build_dev.log")
-                return False
+
+            print(f"❌ Application exited immediately with code: {returncode}")
+            print("ℹ️  Check log file: logs/build_dev.log")
+            return False
 
     except Exception as e:
         print(f"Error launching executable: {e}")
@@ -279,28 +302,32 @@ def main():
     extra_args = args.extra_args or None
 
     try:
-        get_project_root()
+        ensure_cwd_at_project_root()
 
-        # Copy required files
-        if not copy_required_files_dev():
-            print("\nFailed to copy required files!")
-            return 1
+        # Leftovers of interrupted background deletes (e.g. build.old-1234)
+        if count := sweep_discarded_directories():
+            print(f"Removing {count} leftover discarded director(ies)...")
 
-        # Stop existing processes
+        # Copy required files while existing processes are stopped
+        # (independent IO/process-bound steps)
         print("Terminating existing processes...")
-        terminate_existing_processes(
-            exe_name=get_executable_name(),
-            script_name=DEFAULT_SCRIPT_NAME,
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            copy_future = executor.submit(copy_required_files_dev)
+            executor.submit(
+                terminate_existing_processes,
+                exe_name=get_executable_name(),
+                script_names=DEV_APP_SCRIPT_NAMES,
+            ).result()
+
+            if not copy_future.result():
+                print("\nFailed to copy required files!")
+                return 1
 
         # Setup development settings
         check_data(MODE)
 
         # Run build
-        build_success, was_auto_cleaned = run_dev_build(
-            console_mode=console_mode, clean_build=args.clean
-        )
-        if not build_success:
+        if not run_dev_build(console_mode=console_mode, clean_build=args.clean):
             print("\nBuild failed!")
             return 1
 
@@ -310,19 +337,7 @@ def main():
         target_dir = Path("dist/dev")
 
         if source_dir.exists():
-            for item in source_dir.iterdir():
-                target_path = target_dir / item.name
-
-                # Remove if already exists
-                if target_path.exists():
-                    if target_path.is_dir():
-                        shutil.rmtree(target_path)
-                    else:
-                        target_path.unlink()
-
-                shutil.move(str(item), str(target_path))
-
-            source_dir.rmdir()
+            flatten_build_output(source_dir, target_dir)
         else:
             print(
                 f"Warning: Source directory {source_dir} not found. "
@@ -333,20 +348,19 @@ def main():
         print("Terminating existing processes before launch...")
         terminate_existing_processes(
             exe_name=get_executable_name(),
-            script_name=DEFAULT_SCRIPT_NAME,
+            script_names=DEV_APP_SCRIPT_NAMES,
         )
 
+        # Summary first: in console mode the launch may replace this process
+        print("\n===== Development build completed =====")
+        timer.print_duration("development build")
+
         # Launch the built application
         print()
         if not launch_build(extra_args=extra_args, console_mode=console_mode):
             print("\nFailed to launch built application!")
             return 1
 
-        print("\n===== Development build completed and launched =====")
-        if was_auto_cleaned:
-            print("ℹ️  Auto-clean was triggered due to recent Git changes.")
-        timer.print_duration("development build")
-
         return 0
 
     except KeyboardInterrupt:
@@ -4,37 +4,36 @@ Writing Assistant Pro - Final Build Script
 Cross-platform final release build with environment setup
 """
 
+import argparse
 import os
-import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-# Fix for Windows console encoding (emojis)
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
-
 # Import utilities
 from build_utils import (
-    PYINSTALLER_EXCLUSIONS,
+    DEFAULT_SCRIPT_NAME,
+    EXCLUSION_ARGS,
+    FLET_COLLECT_ARGS,
     BuildTimer,
     check_data,
     clear_console,
     copy_required_files,
+    discard_directory,
+    ensure_cwd_at_project_root,
     ensure_icon_exists,
+    fix_console_encoding,
+    get_build_icon,
     get_executable_name,
-    get_project_root,
+    run_pyinstaller,
+    sweep_discarded_directories,
     terminate_existing_processes,
 )
 
+# Fix for Windows console encoding (emojis)
+fix_console_encoding()
+
 # Configuration
-DEFAULT_SCRIPT_NAME = "main.py"
 MODE = "build-final"
 
 
@@ -43,6 +42,31 @@ def copy_required_files_production() -> bool:
     return copy_required_files("production", "production")
 
 
+def clean_dist_only() -> None:
+    """Clean the release output, keeping PyInstaller's build/ cache"""
+    print("Cleaning release output...")
+
+    # Clean dist/production
+    dist_prod_dir = Path("dist/production")
+    if dist_prod_dir.exists():
+        try:
+            discard_directory(dist_prod_dir)
+            print(f"Cleaned: {dist_prod_dir}")
+        except Exception as e:
+            print(f"Warning: Could not clean {dist_prod_dir}: {e}")
+
+    # Clean .spec files (single directory scan)
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if not entry.name.endswith(".spec") or not entry.is_file():
+                continue
+            try:
+                os.unlink(entry.path)
+                print(f"Cleaned: {entry.name}")
+            except Exception as e:
+                print(f"Warning: Could not clean {entry.name}: {e}")
+
+
 def clean_build_directories() -> None:
     """Clean build directories for a fresh build"""
     print("Cleaning build directories...")
@@ -51,38 +75,21 @@ def clean_build_directories() -> None:
     for directory in directories_to_clean:
         if directory.exists():
             try:
-                shutil.rmtree(directory)
+                discard_directory(directory)
                 print(f"Cleaned: {directory}")
             except Exception as e:
                 print(f"Warning: Could not clean {directory}: {e}")
 
-    # Clean dist/production
-    dist_prod_dir = Path("dist/production")
-    if dist_prod_dir.exists():
-        try:
-            shutil.rmtree(dist_prod_dir)
-            print(f"Cleaned: {dist_prod_dir}")
-        except Exception as e:
-            print(f"Warning: Could not clean {dist_prod_dir}: {e}")
-
-    # Clean .spec files
-    for file in Path(".").glob("*.spec"):
-        try:
-            file.unlink()
-            print(f"Cleaned: {file}")
-        except Exception as e:
-            print(f"Warning: Could not clean {file}: {e}")
+    clean_dist_only()
 
 
-def run_build_final() -> bool:
-    """Run PyInstaller build for final release"""
-
-    # Build icon path
-    icon_path = ensure_icon_exists()
-    if not icon_path:
-        print("Error: Icon file not found and could not be generated.")
-        return False
+def get_pyinstaller_command(icon_path: Path, full_clean: bool = False) -> list[str]:
+    """
+    Build the PyInstaller command line for the final release build.
 
+    The build/ work directory is reused between runs (incremental rebuilds);
+    --clean is only passed for a full clean build.
+    """
     # Build PyInstaller command with exclusions - use UV
     pyinstaller_command = [
         "uv",
@@ -91,25 +98,38 @@ def run_build_final() -> bool:
         "PyInstaller",
         "--onefile",  # Single executable file (no _internal folder)
         "--windowed",  # No console
-        f"--icon={icon_path}",
+        f"--icon={get_build_icon(icon_path)}",
         "--name=Writing Assistant Pro",
         "--distpath=dist/production",
-        "--clean",
         "--noconfirm",
-        "--collect-all",
-        "flet",  # Flet assets
+        *FLET_COLLECT_ARGS,  # Flet assets
     ]
 
+    if full_clean:
+        pyinstaller_command.append("--clean")
+
     # Add exclusions
-    for module in PYINSTALLER_EXCLUSIONS:
-        pyinstaller_command.extend(["--exclude-module", module])
+    pyinstaller_command.extend(EXCLUSION_ARGS)
 
     # Add main script
     pyinstaller_command.append(DEFAULT_SCRIPT_NAME)
+    return pyinstaller_command
+
+
+def run_build_final(full_clean: bool = False) -> bool:
+    """Run PyInstaller build for final release"""
+
+    # Build icon path
+    icon_path = ensure_icon_exists()
+    if not icon_path:
+        print("Error: Icon file not found and could not be generated.")
+        return False
+
+    pyinstaller_command = get_pyinstaller_command(icon_path, full_clean)
 
     try:
         print("Starting PyInstaller final build...")
-        subprocess.run(pyinstaller_command, check=True)
+        run_pyinstaller(pyinstaller_command)
         print("PyInstaller final build completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -119,6 +139,14 @@ def run_build_final() -> bool:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Writing Assistant Pro - Final Release Build")
+    parser.add_argument(
+        "--full-clean",
+        action="store_true",
+        help="Also clear PyInstaller's build cache (slower, build from scratch)",
+    )
+    args = parser.parse_args()
+
     clear_console()
     print("===== Writing Assistant Pro - Final Release Build =====")
     print()
@@ -127,10 +155,18 @@ def main():
     timer.start()
 
     try:
-        get_project_root()
+        ensure_cwd_at_project_root()
+
+        # Leftovers of interrupted background deletes (e.g. build.old-1234)
+        if count := sweep_discarded_directories():
+            print(f"Removing {count} leftover discarded director(ies)...")
 
-        # Clean build directories
-        clean_build_directories()
+        # Clean previous output (the build/ cache is kept unless --full-clean)
+        if args.full_clean:
+            clean_build_directories()
+            ensure_icon_exists.cache_clear()
+        else:
+            clean_dist_only()
 
         # Copy required files
         if not copy_required_files_production():
@@ -144,7 +180,7 @@ def main():
         check_data(MODE)
 
         # Run build
-        if not run_build_final():
+        if not run_build_final(full_clean=args.full_clean):
             print("\nBuild failed!")
             return 1
 
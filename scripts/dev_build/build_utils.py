@@ -4,27 +4,128 @@ Writing Assistant Pro - Build Utilities
 Common functions shared across build and launch scripts
 """
 
+import errno
+import hashlib
+import json
 import os
+import re
 import shutil
+import signal
+import stat
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
+try:
+    import psutil
+except ImportError:  # Optional: process lookups fall back to taskkill/pkill
+    psutil = None
 
+# Console helpers are shared by all scripts (scripts/console_utils.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from console_utils import fix_console_encoding, supports_ansi  # noqa: E402
+
+__all__ = [
+    "COPY_MANIFEST_NAME",
+    "DEFAULT_SCRIPT_NAME",
+    "DEV_APP_SCRIPT_NAMES",
+    "DURATION_UNITS",
+    "EXCLUSION_ARGS",
+    "FLET_COLLECT_ARGS",
+    "ICO_SIZES",
+    "IS_WINDOWS",
+    "PROCESS_EXIT_POLL",
+    "PROCESS_EXIT_TIMEOUT",
+    "PROCESS_EXIT_WAIT",
+    "PYINSTALLER_EXCLUSIONS",
+    "BuildTimer",
+    "check_data",
+    "clear_console",
+    "convert_png_to_ico",
+    "copy_file",
+    "copy_required_files",
+    "copytree_scandir",
+    "discard_directory",
+    "ensure_cwd_at_project_root",
+    "ensure_icon_exists",
+    "fast_copytree",
+    "fast_rmtree",
+    "fix_console_encoding",
+    "get_build_icon",
+    "get_executable_name",
+    "get_project_root",
+    "kill_existing_exe_process",
+    "kill_python_script_process",
+    "move_same_fs",
+    "run_pyinstaller",
+    "supports_ansi",
+    "sweep_discarded_directories",
+    "terminate_existing_processes",
+    "tree_digest",
+    "wait_for_discarded_directories",
+]
+
+# Platform check shared by the build and launch scripts (evaluated once)
+IS_WINDOWS = os.name == "nt"
+
+# Single application entry point (Flet), shared by the build and launch scripts
+DEFAULT_SCRIPT_NAME = "main.py"
+
+# Command lines of a running dev app: run_dev.py runs main.py in its own
+# interpreter when started from the project venv (uv run)
+DEV_APP_SCRIPT_NAMES = (DEFAULT_SCRIPT_NAME, "run_dev.py")
+
+# Build output root (relative to the project root, the working directory)
+_DIST = Path("dist")
+
+# Digests of the copied source trees, stored in dist/<target_dir>/
+COPY_MANIFEST_NAME = ".copy_manifest.json"
+
+# Seconds terminated processes get to exit before being killed (psutil)
+PROCESS_EXIT_TIMEOUT = 2.0
+
+# Upper bound and poll interval (seconds) when waiting for killed processes
+# to exit without psutil
+PROCESS_EXIT_WAIT = 0.5
+PROCESS_EXIT_POLL = 0.02
+
+# Sizes embedded in the executable icon (Windows picks the best match)
+ICO_SIZES = [(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the project root directory"""
+    """
+    Get the project root directory.
+    Memoized: resolved once per process. Pure lookup, callers that need it as
+    the working directory use ensure_cwd_at_project_root().
+    """
     script_dir = Path(__file__).parent  # scripts/dev_build/
     scripts_dir = script_dir.parent  # scripts/
-    project_root = scripts_dir.parent  # project root
-    os.chdir(project_root)
+    return scripts_dir.parent  # project root
+
+
+def ensure_cwd_at_project_root() -> Path:
+    """
+    Make the project root the working directory (called once at script entry).
+    Build paths (dist/, build/, config.json...) are relative to it.
+    """
+    project_root = get_project_root()
+    if Path.cwd() != project_root:
+        os.chdir(project_root)
     return project_root
 
 
+@lru_cache(maxsize=1)
 def ensure_icon_exists() -> Path | None:
     """
     Get the icon path from src/core/config/icons/app_icon.png.
     PyInstaller supports PNG icons on all platforms.
+    The result is memoized for the session (cleared on clean builds).
     """
     project_root = get_project_root()
     png_path = project_root / "src" / "core" / "config" / "icons" / "app_icon.png"
@@ -37,6 +138,74 @@ def ensure_icon_exists() -> Path | None:
     return png_path
 
 
+def convert_png_to_ico(png_path: Path, ico_path: Path) -> None:
+    """
+    Convert a PNG image to a multi-size ICO file with Pillow.
+
+    The source is decoded and converted to RGBA once, then shrunk to the
+    largest icon size, so each ICO size is resampled from a small buffer.
+    """
+    from PIL import Image
+
+    ico_path.parent.mkdir(parents=True, exist_ok=True)
+    with Image.open(png_path) as source:
+        img = source.convert("RGBA")
+
+    largest = max(ICO_SIZES)
+    img.thumbnail(largest, Image.Resampling.LANCZOS)
+    img.save(ico_path, format="ICO", sizes=ICO_SIZES)
+
+
+def get_build_icon(png_path: Path) -> Path:
+    """
+    Get the executable icon to pass to PyInstaller.
+
+    On Windows, PyInstaller converts PNG icons to ICO on every build. The
+    conversion is done here once, into build/icons/, and reused as long as
+    the PNG is not newer. Other platforms use the PNG directly.
+    """
+    if not IS_WINDOWS:
+        return png_path
+
+    ico_path = Path("build") / "icons" / f"{png_path.stem}.ico"
+    try:
+        if ico_path.stat().st_mtime >= png_path.stat().st_mtime:
+            return ico_path
+    except FileNotFoundError:
+        pass
+
+    try:
+        convert_png_to_ico(png_path, ico_path)
+    except Exception as e:
+        print(f"Warning: Could not convert icon to ICO ({e}), using PNG")
+        return png_path
+
+    print(f"✓ Icon converted to: {ico_path}")
+    return ico_path
+
+
+@lru_cache
+def _cached_exists(path: str) -> bool:
+    """
+    Memoized os.path.exists for the build bookkeeping paths.
+    Cleared by copy_required_files, the step that creates files in dist/.
+    """
+    return os.path.exists(path)
+
+
+def _scan_entries(directory: str) -> dict[str, os.DirEntry]:
+    """
+    List a directory once, keyed by entry name (empty if it does not exist).
+    DirEntry caches the file type, so existence and is_dir() checks need no
+    further syscall.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except FileNotFoundError:
+        return {}
+
+
 def check_data(mode: str) -> None:
     """
     Checks data file path to provide feedback to the user based on build mode.
@@ -47,19 +216,19 @@ def check_data(mode: str) -> None:
 
     if mode == "build-final":
         print("Setting up production settings...")
-        dist_dir = Path("dist/production")
+        dist_dir = _DIST / "production"
         data_filename = "data.json"
         settings_type = "production"
     else:  # build-dev
         print("Setting up development settings...")
-        dist_dir = Path("dist/dev")
+        dist_dir = _DIST / "dev"
         data_filename = "data_dev.json"
         settings_type = "development"
 
     data_path = dist_dir / data_filename
     cwd = Path(".")
 
-    if data_path.exists():
+    if _cached_exists(str(data_path)):
         print(f"Using existing {settings_type} settings from: {cwd / data_path}")
     else:
         print(
@@ -71,7 +240,292 @@ def check_data(mode: str) -> None:
 
 def clear_console() -> None:
     """Clear console screen (cross-platform)"""
-    os.system("cls" if os.name == "nt" else "clear")
+    if supports_ansi():
+        # Cursor home, clear the screen and the scrollback, without a subshell
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
+        return
+    os.system("cls" if IS_WINDOWS else "clear")
+
+
+def move_same_fs(src: Path, dst: Path) -> None:
+    """
+    Move a file or directory, as a plain rename when possible.
+
+    os.replace is a single metadata update on the same filesystem (and
+    replaces an existing file at dst). Only a cross-device move (EXDEV)
+    falls back to shutil.move, which copies then deletes.
+
+    Args:
+        src (Path): Source file or directory
+        dst (Path): Destination path
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _remove_writable(remove, path: str) -> None:
+    """
+    Call os.unlink/os.rmdir on path, clearing the read-only attribute once if
+    Windows refuses to delete it (e.g. files copied from a read-only checkout).
+    """
+    try:
+        remove(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        remove(path)
+
+
+def fast_rmtree(path: Path, ignore_errors: bool = False) -> None:
+    """
+    Recursively delete a directory tree.
+
+    On Windows every file deletion is a slow round trip, so the tree is
+    scanned once, files are unlinked from a thread pool, then the emptied
+    directories are removed bottom-up. Read-only entries are made writable
+    and deleted again. Other platforms use shutil.rmtree, which is already
+    fast there (fd-based, one listing per directory).
+
+    Args:
+        path (Path): Directory to delete
+        ignore_errors (bool): Ignore deletion errors, like shutil.rmtree
+    """
+    if not IS_WINDOWS:
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+        return
+
+    try:
+        files: list[str] = []
+        directories: list[str] = []
+        pending = [os.fspath(path)]
+        while pending:
+            current = pending.pop()
+            directories.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_junction():
+                        # Remove the link itself, never its target
+                        directories.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        files.append(entry.path)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(partial(_remove_writable, os.unlink), files))
+
+        # Children are always listed after their parent
+        for directory in reversed(directories):
+            _remove_writable(os.rmdir, directory)
+    except OSError:
+        # Let shutil report (or ignore) whatever is left
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+
+
+# Background deletions started by discard_directory()
+_discard_threads: list[threading.Thread] = []
+
+
+def discard_directory(directory: Path) -> None:
+    """
+    Remove a directory without waiting for the recursive delete.
+
+    The directory is renamed out of the way (a single metadata update), so it
+    can be recreated immediately, and the slow per-file delete runs in a
+    background thread. The thread is not a daemon: the script still waits for
+    the delete to finish before exiting.
+
+    Args:
+        directory (Path): Directory to remove
+    """
+    trash = directory.with_name(f"{directory.name}.old-{os.getpid()}")
+    try:
+        os.replace(directory, trash)
+    except OSError:
+        # Rename refused (e.g. a file is locked), delete in place
+        fast_rmtree(directory)
+        return
+
+    thread = threading.Thread(target=fast_rmtree, args=(trash,), kwargs={"ignore_errors": True})
+    thread.start()
+    _discard_threads.append(thread)
+
+
+def wait_for_discarded_directories() -> None:
+    """Wait for the background deletions started by discard_directory()"""
+    while _discard_threads:
+        _discard_threads.pop().join()
+
+
+# Name given by discard_directory() to a directory being deleted
+_DISCARDED_NAME = re.compile(r".+\.old-(\d+)")
+# Directories in which the build scripts discard directories
+_DISCARD_PARENTS = (Path("."), _DIST, _DIST / "dev")
+
+
+def sweep_discarded_directories() -> int:
+    """
+    Delete the leftovers of earlier discard_directory() calls.
+
+    The background delete ignores errors, so a file locked at the time (or an
+    interrupted build) leaves its "<name>.old-<pid>" directory behind. The
+    build scripts sweep the project root, dist/ and dist/dev/ at the start of
+    every build. Directories discarded by this process are still being
+    deleted and are skipped.
+
+    Returns:
+        int: Number of leftover directories removed in the background
+    """
+    own_pid = str(os.getpid())
+    count = 0
+    for parent in _DISCARD_PARENTS:
+        for name, entry in _scan_entries(str(parent)).items():
+            match = _DISCARDED_NAME.fullmatch(name)
+            if not match or match.group(1) == own_pid or not entry.is_dir(follow_symlinks=False):
+                continue
+            thread = threading.Thread(
+                target=fast_rmtree, args=(Path(entry.path),), kwargs={"ignore_errors": True}
+            )
+            thread.start()
+            _discard_threads.append(thread)
+            count += 1
+    return count
+
+
+def tree_digest(src: str | Path) -> str:
+    """
+    Hash the relative path, size and st_mtime_ns of every file under src.
+
+    Only the directory listings are read (DirEntry stats), not the file
+    contents: any added, removed or modified file changes the digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    def walk(directory: str, prefix: str) -> None:
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                relpath = f"{prefix}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    walk(entry.path, f"{relpath}/")
+                else:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    digest.update(
+                        f"{relpath}\0{entry_stat.st_size}\0{entry_stat.st_mtime_ns}\0".encode()
+                    )
+
+    walk(str(src), "")
+    return digest.hexdigest()
+
+
+def copy_file(src: str | Path, dst: str | Path) -> None:
+    """
+    Copy a file's content to dst with the platform's native copy.
+
+    On Windows, CopyFileW lets the OS copy the file (block cloning/offloaded
+    copies where the filesystem supports it) instead of Python's read/write
+    loop. On POSIX, shutil.copyfile already copies in the kernel
+    (sendfile on Linux, fcopyfile on macOS).
+
+    Args:
+        src (str | Path): Source file
+        dst (str | Path): Destination file (overwritten)
+
+    Raises:
+        OSError: If the copy fails
+    """
+    if IS_WINDOWS:
+        import ctypes
+
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):  # type: ignore[attr-defined]
+            raise ctypes.WinError()  # type: ignore[attr-defined]
+        return
+
+    shutil.copyfile(src, dst)
+
+
+def copytree_scandir(src: str, dst: str) -> None:
+    """
+    Copy a directory tree into dst, skipping files that did not change.
+
+    Walks the tree with os.scandir and reuses each DirEntry's stat (cached
+    by the directory listing on Windows) for both the change check and the
+    timestamps set on the copy, instead of shutil.copytree + copystat
+    stat-ing every file again. A file is skipped when its size and
+    st_mtime_ns match the previous copy.
+
+    Args:
+        src (str): Source directory
+        dst (str): Destination directory
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                copytree_scandir(entry.path, target)
+                continue
+
+            src_stat = entry.stat(follow_symlinks=False)
+            try:
+                dst_stat = os.stat(target)
+                if (
+                    dst_stat.st_size == src_stat.st_size
+                    and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+                ):
+                    continue
+            except FileNotFoundError:
+                pass
+
+            copy_file(entry.path, target)
+            # Same timestamps as the source: the next run sees it as unchanged
+            os.utime(target, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def fast_copytree(src: str | Path, dst: str | Path) -> None:
+    """
+    Mirror a directory tree into dst, copying only new or modified files.
+
+    Uses the platform's native tool when available: robocopy (multi-threaded)
+    on Windows, rsync on POSIX. Falls back to copytree_scandir. Files
+    removed from src are also removed from dst, except on the fallback.
+
+    Args:
+        src (str | Path): Source directory
+        dst (str | Path): Destination directory
+
+    Raises:
+        subprocess.CalledProcessError: If the native tool reports a failure
+    """
+    if IS_WINDOWS:
+        command = [
+            "robocopy",
+            os.fspath(src),
+            os.fspath(dst),
+            "/MIR",  # /E plus removal of files deleted from the source
+            "/MT:16",
+            "/NFL",
+            "/NDL",
+            "/NJH",
+            "/NJS",
+            "/NP",
+        ]
+        result = subprocess.run(command, check=False, capture_output=True)
+        # robocopy exit codes below 8 all mean success (bit flags)
+        if result.returncode >= 8:
+            raise subprocess.CalledProcessError(result.returncode, command)
+        return
+
+    if shutil.which("rsync"):
+        # Trailing slashes: copy the contents of src into dst
+        command = ["rsync", "-a", "--delete", f"{src}/", f"{dst}/"]
+        subprocess.run(command, check=True, capture_output=True)
+        return
+
+    copytree_scandir(os.fspath(src), os.fspath(dst))
 
 
 def copy_required_files(build_type: str, target_dir: str) -> bool:
@@ -82,48 +536,103 @@ def copy_required_files(build_type: str, target_dir: str) -> bool:
         build_type (str): Type of build ('development' or 'production')
         target_dir (str): Target directory name (e.g., 'dev', 'production')
     """
+    # Files in dist/ are about to change
+    _cached_exists.cache_clear()
+
     # Create target directory
-    dist_target_dir = Path(f"dist/{target_dir}")
+    dist_target_dir = _DIST / target_dir
     dist_target_dir.mkdir(parents=True, exist_ok=True)
     cwd = Path(".")
 
     # Only copy what actually exists in the CURRENT project structure
     # Icons and config are now in src/core/config/
+    config_dir = "src/core/config"
+    sources = [
+        (".", "styles"),
+        (".", "translations"),
+        (config_dir, "config.json"),
+        (config_dir, "icons"),
+    ]
+    # (parent, name, source, destination), with the paths as plain strings
+    # computed once for the os.* calls below
+    dist_target = os.fspath(dist_target_dir)
     items_to_copy = [
-        (Path("styles"), dist_target_dir / "styles"),
-        (Path("translations"), dist_target_dir / "translations"),
-        (Path("src/core/config/config.json"), dist_target_dir / "config.json"),
-        (Path("src/core/config/icons"), dist_target_dir / "icons"),
+        (
+            parent,
+            name,
+            os.path.normpath(os.path.join(parent, name)),
+            os.path.join(dist_target, name),
+        )
+        for parent, name in sources
     ]
 
+    # The sources live in two directories: list each one once instead of
+    # stat-ing every source
+    parent_entries = {parent: _scan_entries(parent) for parent in (".", config_dir)}
+
+    # Source trees unchanged since the last copy are skipped entirely
+    manifest_path = dist_target_dir / COPY_MANIFEST_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+    previous_manifest = dict(manifest)
+
     print(f"Copying required files for {build_type} build to {cwd}/dist/{target_dir}/...")
 
-    for src, dst in items_to_copy:
-        try:
-            if not src.exists():
-                # config.json might not exist yet, that's fine
-                if src.name == "config.json":
-                    continue
-                print(f"Warning: File/directory not found: {src}")
-                continue
+    def copy_item(parent: str, name: str, src: str, dst: str) -> str | None:
+        """Copy one source, returning the line to report (if any)"""
+        entry = parent_entries[parent].get(name)
+        if entry is None:
+            # config.json might not exist yet, that's fine
+            if name != "config.json":
+                return f"Warning: File/directory not found: {src}"
+            return None
 
-            # Skip config.json if it already exists in destination
-            # to preserve user modifications (hotkey, language, etc.)
-            if src.name == "config.json" and dst.exists():
-                print(f"Skipping: {dst} (already exists, preserving user settings)")
-                continue
+        # Skip config.json if it already exists in destination
+        # to preserve user modifications (hotkey, language, etc.)
+        if name == "config.json" and _cached_exists(dst):
+            return f"Skipping: {dst} (already exists, preserving user settings)"
 
-            if src.is_dir():
-                if dst.exists():
-                    shutil.rmtree(dst)
-                shutil.copytree(src, dst)
-            else:
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
-            print(f"Copied: {src} -> {dst}")
+        if entry.is_dir():
+            digest = tree_digest(src)
+            if manifest.get(name) == digest and _cached_exists(dst):
+                return f"Up to date: {dst}"
+
+            # Incremental: only new or modified files are copied
+            fast_copytree(src, dst)
+            manifest[name] = digest  # Distinct key per item
+        else:
+            # Files are copied directly into dist_target_dir (created above),
+            # through a temporary file renamed over dst: readers (a running
+            # build) never see a partially written file
+            tmp = f"{dst}.tmp"
+            copy_file(src, tmp)
+            shutil.copystat(src, tmp)
+            os.replace(tmp, dst)
+        return f"Copied: {src} -> {dst}"
+
+    # Items go to distinct destinations: copy them concurrently, then
+    # report in order once all of them are done
+    with ThreadPoolExecutor(max_workers=len(items_to_copy)) as executor:
+        futures = [executor.submit(copy_item, *item) for item in items_to_copy]
+
+    errors = []
+    for (_, _, src, _), future in zip(items_to_copy, futures, strict=True):
+        try:
+            message = future.result()
         except Exception as e:
-            print(f"Error copying {src}: {e}")
-            return False
+            errors.append(f"Error copying {src}: {e}")
+            continue
+        if message:
+            print(message)
+
+    if errors:
+        print("\n".join(errors))
+        return False
+
+    if manifest != previous_manifest:
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
 
     # Log logic reminder
     if build_type == "development":
@@ -134,37 +643,196 @@ def copy_required_files(build_type: str, target_dir: str) -> bool:
     return True
 
 
+def run_pyinstaller(command: list[str]) -> None:
+    """
+    Run PyInstaller with its output read through a pipe.
+
+    PyInstaller writes into a pipe drained line by line instead of the
+    inherited console. With WAP_QUIET=1 (e.g. on CI) the output is kept in
+    memory and only printed if the build fails.
+
+    Args:
+        command (list[str]): Full PyInstaller command line
+
+    Raises:
+        subprocess.CalledProcessError: If PyInstaller exits with an error
+    """
+    quiet = os.environ.get("WAP_QUIET") == "1"
+    output: list[str] = []
+
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            if quiet:
+                output.append(line)
+            else:
+                sys.stdout.write(line)
+
+    if process.returncode:
+        sys.stdout.writelines(output)
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+@lru_cache
 def get_executable_name(base_name: str = "Writing Assistant Pro") -> str:
     """Get the correct executable name for the current platform"""
-    if sys.platform.startswith("win"):
+    if IS_WINDOWS:
         return f"{base_name}.exe"
     return base_name
 
 
-def kill_existing_exe_process(process_name: str) -> None:
-    """Terminate an existing process by its name."""
+def _terminate_processes(processes: list) -> int:
+    """
+    Terminate psutil processes, force-killing those that do not exit in time.
+
+    Returns:
+        int: Number of processes that were signalled
+    """
+    terminated = []
+    for process in processes:
+        try:
+            process.terminate()
+            terminated.append(process)
+        except psutil.Error:
+            pass
+
+    _, alive = psutil.wait_procs(terminated, timeout=PROCESS_EXIT_TIMEOUT)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    return len(terminated)
+
+
+def _terminate_processes_by_name(process_name: str) -> bool:
+    """Terminate processes by exact name in-process with psutil."""
+    matched = [
+        process for process in psutil.process_iter(["name"]) if process.info["name"] == process_name
+    ]
+
+    if not _terminate_processes(matched):
+        print(f"No existing process found for: {process_name}")
+        return False
+    print(f"Terminated existing process: {process_name}")
+    return True
+
+
+def _terminate_python_script(script_name: str) -> bool:
+    """Terminate Python processes running a script, matched on their command line."""
+    # Never match this build script or the shell/uv process that started it
+    own_pids = {os.getpid(), os.getppid()}
+    matched = []
+    for process in psutil.process_iter(["name", "cmdline"]):
+        name = (process.info["name"] or "").lower()
+        cmdline = process.info["cmdline"] or []
+        if (
+            process.pid not in own_pids
+            and name.startswith("python")
+            and any(arg.endswith(script_name) for arg in cmdline[1:])
+        ):
+            matched.append(process)
+
+    count = _terminate_processes(matched)
+    if count:
+        print(f"Successfully terminated {count} Python process(es) running: {script_name}")
+    else:
+        print(f"No existing Python process found for: {script_name}")
+    return bool(count)
+
+
+def _signal_pids(pids: list[int]) -> list[int]:
+    """Send SIGTERM to POSIX processes, returning the PIDs that were signalled."""
+    signalled = []
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            signalled.append(pid)
+        except OSError:
+            pass
+    return signalled
+
+
+def _wait_for_exit(pids: list[int]) -> None:
+    """
+    Poll until the POSIX processes are gone, at most PROCESS_EXIT_WAIT seconds,
+    then force-kill the remaining ones (like the psutil path).
+    """
+    deadline = time.monotonic() + PROCESS_EXIT_WAIT
+    remaining = list(pids)
+    while remaining and time.monotonic() < deadline:
+        time.sleep(PROCESS_EXIT_POLL)
+        alive = []
+        for pid in remaining:
+            try:
+                os.kill(pid, 0)  # Signal 0: existence check only
+                alive.append(pid)
+            except OSError:
+                pass
+        remaining = alive
+
+    for pid in remaining:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def kill_existing_exe_process(process_name: str) -> bool:
+    """
+    Terminate an existing process by its name.
+
+    Returns:
+        bool: True if a process was terminated
+    """
     try:
-        if sys.platform.startswith("win"):
-            command = ["taskkill", "/F", "/IM", process_name]
+        if psutil is not None:
+            return _terminate_processes_by_name(process_name)
+        elif IS_WINDOWS:
+            # /T: also stop the child processes (Flet client) of every instance
+            command = ["taskkill", "/F", "/T", "/IM", process_name]
             result = subprocess.run(command, check=False, capture_output=True, text=True)
 
             if result.returncode == 0:
                 print(f"Terminated existing process: {process_name}")
+                return True
             elif "not found" in result.stderr.lower() or "cannot find" in result.stderr.lower():
                 print(f"No existing process found for: {process_name}")
         else:
-            command = ["pkill", "-x", process_name]
-            result = subprocess.run(command, check=False, capture_output=True)
-            if result.returncode == 0:
+            # pgrep + SIGTERM (like pkill -x), keeping the PIDs to wait for them
+            command = ["pgrep", "-x", process_name]
+            result = subprocess.run(command, check=False, capture_output=True, text=True)
+            pids = [int(pid) for pid in result.stdout.split()] if result.returncode == 0 else []
+            signalled = _signal_pids(pids)
+            if signalled:
+                _wait_for_exit(signalled)
                 print(f"Terminated existing process: {process_name}")
+                return True
     except Exception as e:
         print(f"Warning: Error while trying to kill process {process_name}: {e}")
+    return False
+
 
+def kill_python_script_process(script_name: str) -> bool:
+    """
+    Terminate a Python script process by its command line.
 
-def kill_python_script_process(script_name: str) -> None:
-    """Terminate a Python script process by its command line."""
+    Returns:
+        bool: True if a process was terminated
+    """
     try:
-        if sys.platform.startswith("win"):
+        if psutil is not None:
+            # In-process lookup: no wmic (slow COM start-up) or pgrep/pkill
+            return _terminate_python_script(script_name)
+        elif IS_WINDOWS:
             # Method 1: Use tasklist + taskkill for more reliable process detection
             # First, get the list of processes with command lines
             list_command = [
@@ -189,21 +857,23 @@ def kill_python_script_process(script_name: str) -> None:
                             pids.append(pid)
 
                 if pids:
-                    # Kill each process by PID
-                    killed_count = 0
+                    # Kill all processes with a single taskkill (one /PID per process)
+                    kill_cmd = ["taskkill", "/F"]
                     for pid in pids:
-                        kill_cmd = ["taskkill", "/F", "/PID", pid]
-                        kill_result = subprocess.run(
-                            kill_cmd, check=False, capture_output=True, text=True
-                        )
-                        if kill_result.returncode == 0:
-                            killed_count += 1
+                        kill_cmd.extend(("/PID", pid))
+                    kill_result = subprocess.run(
+                        kill_cmd, check=False, capture_output=True, text=True
+                    )
+                    # One stdout line per terminated process (errors go to
+                    # stderr), independent of the Windows display language
+                    killed_count = len(kill_result.stdout.strip().splitlines())
 
                     if killed_count > 0:
                         print(
                             f"Successfully terminated {killed_count} Python process(es) "
                             f"running: {script_name}"
                         )
+                        return True
                     else:
                         print(
                             f"Found Python processes for {script_name} but failed to terminate them"
@@ -214,52 +884,61 @@ def kill_python_script_process(script_name: str) -> None:
                 print(f"No existing Python process found for: {script_name}")
 
         else:
-            # For macOS and Linux, use more precise matching
-            # Use pgrep to find processes first, then pkill
-            grep_command = ["pgrep", "-f", f"python.*{script_name}"]
+            # For macOS and Linux: a single pgrep scan, then signal the PIDs
+            # directly (pkill would scan the process table a second time)
+            # The script name is escaped: "." must not match any character
+            grep_command = ["pgrep", "-f", f"python.*{re.escape(script_name)}"]
             result = subprocess.run(grep_command, check=False, capture_output=True, text=True)
+            # Never match this build script or the shell/uv process that started it
+            own_pids = {os.getpid(), os.getppid()}
+            pids = [int(pid) for pid in result.stdout.split()] if result.returncode == 0 else []
+            pids = [pid for pid in pids if pid not in own_pids]
 
-            if result.returncode == 0 and result.stdout.strip():
-                # Found processes, now kill them
-                kill_command = ["pkill", "-f", f"python.*{script_name}"]
-                kill_result = subprocess.run(
-                    kill_command, check=False, capture_output=True, text=True
+            signalled = _signal_pids(pids)
+            if signalled:
+                _wait_for_exit(signalled)
+                print(
+                    f"Successfully terminated {len(signalled)} Python process(es) "
+                    f"running: {script_name}"
                 )
-
-                if kill_result.returncode == 0:
-                    pids = result.stdout.strip().split("\n")
-                    print(
-                        f"Successfully terminated {len(pids)} Python process(es) "
-                        f"running: {script_name}"
-                    )
-                else:
-                    print(f"Found Python processes for {script_name} but failed to terminate them")
+                return True
+            elif pids:
+                print(f"Found Python processes for {script_name} but failed to terminate them")
             else:
                 print(f"No existing Python process found for: {script_name}")
 
     except Exception as e:
         print(f"Warning: Error while trying to kill Python script process {script_name}: {e}")
+    return False
 
 
 def terminate_existing_processes(
-    exe_name: str | None = None, script_name: str | None = None
+    exe_name: str | None = None, script_names: tuple[str, ...] = ()
 ) -> None:
-    """Terminate any existing Writing Assistant Pro processes (both exe and script)"""
+    """Terminate any existing Writing Assistant Pro processes (both exe and scripts)"""
     print("Checking for existing processes...")
 
-    # Kill Python script first (to avoid conflicts)
-    if script_name:
+    # Kill Python scripts first (to avoid conflicts)
+    killed = False
+    for script_name in script_names:
         print(f"Looking for Python script processes: {script_name}")
-        kill_python_script_process(script_name)
+        killed = kill_python_script_process(script_name) or killed
 
     if exe_name:
         print(f"Looking for: {exe_name}")
-        kill_existing_exe_process(exe_name)
+        killed = kill_existing_exe_process(exe_name) or killed
 
-    time.sleep(0.5)
+    # psutil and the POSIX fallbacks already waited for the processes to exit.
+    # taskkill returns before Windows released their files: only then pause
+    if killed and psutil is None and IS_WINDOWS:
+        time.sleep(PROCESS_EXIT_WAIT)
     print("Process termination check completed.")
 
 
+# Whole units shown by BuildTimer.print_duration, largest first
+DURATION_UNITS = ((3600, "hour"), (60, "minute"))
+
+
 class BuildTimer:
     """A simple timer class to measure build duration"""
 
@@ -269,7 +948,7 @@ class BuildTimer:
 
     def start(self):
         """Start the timer"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         print("Build timer started...")
 
     def stop(self):
@@ -277,7 +956,7 @@ class BuildTimer:
         if self.start_time is None:
             return 0.0
 
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
         return self.end_time - self.start_time
 
     def print_duration(self, build_type: str = "build"):
@@ -290,21 +969,16 @@ class BuildTimer:
         else:
             elapsed = self.end_time - self.start_time
 
-        if elapsed < 60:
-            time_str = f"{elapsed:.1f} seconds"
-        elif elapsed < 3600:
-            minutes = int(elapsed // 60)
-            seconds = elapsed % 60
-            time_str = f"{minutes} minute{'s' if minutes > 1 else ''} and {seconds:.1f} seconds"
-        else:
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = elapsed % 60
-            time_str = (
-                f"{hours} hour{'s' if hours > 1 else ''}, "
-                f"{minutes} minute{'s' if minutes > 1 else ''} and "
-                f"{seconds:.1f} seconds"
-            )
+        # Whole units from the lookup table, then the fractional seconds
+        parts = []
+        remainder = elapsed
+        for size, unit in DURATION_UNITS:
+            count, remainder = divmod(remainder, size)
+            if count:
+                parts.append(f"{int(count)} {unit}{'s' if count > 1 else ''}")
+        time_str = f"{remainder:.1f} seconds"
+        if parts:
+            time_str = f"{', '.join(parts)} and {time_str}"
 
         print(f"{build_type.capitalize()} completed in {time_str}")
 
@@ -324,4 +998,30 @@ PYINSTALLER_EXCLUSIONS = [
     "numpy",
     "pandas",
     "scipy",
+    # GUI toolkits pulled in by optional hooks (the app only uses Flet)
+    "PyQt5",
+    "PyQt6",
+    "PySide2",
+    "PySide6",
+    # Development / packaging tooling, never imported at runtime
+    "pytest",
+    "setuptools",
+    "pip",
+    "test",
 ]
+
+# Flet is pure Python: its assets, submodules and package metadata are all
+# it needs (--collect-all would also scan it for binaries)
+FLET_COLLECT_ARGS = (
+    "--collect-data",
+    "flet",
+    "--collect-submodules",
+    "flet",
+    "--copy-metadata",
+    "flet",
+)
+
+# Ready-made PyInstaller arguments for the exclusions (built once)
+EXCLUSION_ARGS = tuple(
+    arg for module in PYINSTALLER_EXCLUSIONS for arg in ("--exclude-module", module)
+)
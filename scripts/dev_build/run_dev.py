@@ -2,10 +2,12 @@
 Development script - Launches main.py with --debug argument
 
 Usage:
-    uv run python scripts/dev_build/run_dev.py
+    uv run python scripts/dev_build/run_dev.py [--detach]
 """
 
+import argparse
 import os
+import runpy
 import subprocess
 import sys
 from pathlib import Path
@@ -13,25 +15,49 @@ from pathlib import Path
 # Add parent directory to path to allow importing from package
 sys.path.insert(0, str(Path(__file__).parent))
 
-from build_utils import check_data, copy_required_files
+from build_utils import (
+    DEFAULT_SCRIPT_NAME,
+    IS_WINDOWS,
+    check_data,
+    copy_required_files,
+    fix_console_encoding,
+)
 
 # Fix Unicode encoding for Windows console
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
+fix_console_encoding()
 
 # Configuration
-DEFAULT_SCRIPT_NAME = "main.py"
 MODE = "development"
 
 
+def is_project_venv(project_root: Path) -> bool:
+    """Check whether this interpreter runs from the project's .venv"""
+    try:
+        return Path(sys.prefix).resolve() == (project_root / ".venv").resolve()
+    except OSError:
+        return False
+
+
+def launch_detached(command: list[str]) -> None:
+    """Start the app in its own session/process group and return immediately"""
+    if IS_WINDOWS:
+        process = subprocess.Popen(command, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        process = subprocess.Popen(command, start_new_session=True)
+    print(f"✅ Application started (PID {process.pid})")
+    print("ℹ️  Log file: logs/run_dev.log")
+
+
 def main():
     """Launch main.py in debug mode"""
+    parser = argparse.ArgumentParser(description="Writing Assistant Pro - Development Run")
+    parser.add_argument(
+        "--detach",
+        action="store_true",
+        help="Start the app in a new process group and return immediately",
+    )
+    args = parser.parse_args()
+
     print(f"🚀 Starting in {MODE} mode...")
     print("─" * 50)
 
@@ -41,10 +67,40 @@ def main():
 
     check_data("build-dev")  # Use build-dev mode to setup data_dev.json path logic
 
-    main_path = Path(__file__).parent.parent.parent / DEFAULT_SCRIPT_NAME
-    result = subprocess.run(
-        ["uv", "run", "python", str(main_path), "--debug", "--log-file", "run_dev.log"]
-    )
+    project_root = Path(__file__).parent.parent.parent
+    main_path = project_root / DEFAULT_SCRIPT_NAME
+    app_args = ["--debug", "--log-file", "run_dev.log"]
+    in_project_venv = is_project_venv(project_root)
+
+    if args.detach:
+        # In the project venv, start Python directly (no uv process in the tree)
+        if in_project_venv:
+            launch_detached([sys.executable, str(main_path), *app_args])
+        else:
+            launch_detached(["uv", "run", "python", str(main_path), *app_args])
+        return
+
+    if in_project_venv:
+        # Already running in the project environment (uv run): run main.py in
+        # this interpreter instead of spawning uv and a second Python
+        sys.argv = [str(main_path), *app_args]
+        sys.path.insert(0, str(project_root))
+        try:
+            runpy.run_path(str(main_path), run_name="__main__")
+        finally:
+            print("\nℹ️  Log file: logs/run_dev.log")
+        return
+
+    uv_command = ["uv", "run", "python", str(main_path), *app_args]
+
+    if not IS_WINDOWS:
+        # Nothing left to do after launch: replace this process with uv
+        # instead of keeping an idle parent interpreter for the app lifetime
+        print("ℹ️  Log file: logs/run_dev.log\n", flush=True)
+        os.execvp("uv", uv_command)
+
+    # exec is emulated with a child process on Windows: keep the blocking run
+    result = subprocess.run(uv_command)
     print("\nℹ️  Log file: logs/run_dev.log")
     sys.exit(result.returncode)
 
@@ -0,0 +1,88 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for the development build (--onedir, dist/dev)
+
+Used by build_dev.py so PyInstaller reuses this spec instead of generating one
+from command line flags on every build. Per-build options come after "--":
+
+    --console          Show the console (windowed otherwise)
+    --icon PATH        Executable icon
+    --splash PATH      Splash screen image (not supported on macOS)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules, copy_metadata
+
+# Share the entry point and exclusions with the command line builds
+sys.path.insert(0, SPECPATH)
+from build_utils import DEFAULT_SCRIPT_NAME, PYINSTALLER_EXCLUSIONS
+
+parser = argparse.ArgumentParser(prog="writing_assistant_pro_dev.spec")
+parser.add_argument("--console", action="store_true")
+parser.add_argument("--icon")
+parser.add_argument("--splash")
+options = parser.parse_args()
+
+APP_NAME = "Writing Assistant Pro"
+PROJECT_ROOT = Path(SPECPATH).parent.parent
+
+a = Analysis(
+    [str(PROJECT_ROOT / DEFAULT_SCRIPT_NAME)],
+    pathex=[str(PROJECT_ROOT)],
+    binaries=[],
+    # Flet is pure Python: assets, lazily imported submodules and metadata
+    datas=collect_data_files("flet") + copy_metadata("flet"),
+    hiddenimports=collect_submodules("flet"),
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=PYINSTALLER_EXCLUSIONS,
+    noarchive=False,
+    optimize=2,  # Strip docstrings and asserts from bundled bytecode
+)
+pyz = PYZ(a.pure)
+
+# Splash screen shown by the bootloader while Flet and the UI are imported
+splash = None
+if options.splash:
+    splash = Splash(
+        options.splash,
+        binaries=a.binaries,
+        datas=a.datas,
+        text_pos=None,
+        minify_script=True,
+        always_on_top=True,
+    )
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    *([splash] if splash else []),
+    [],
+    exclude_binaries=True,
+    name=APP_NAME,
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=options.console,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=[options.icon] if options.icon else None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    *([splash.binaries] if splash else []),
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name=APP_NAME,
+)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Writing Assistant Pro - Lint Utilities
+Commands and helpers shared by the quality scripts
+"""
+
+import os
+import subprocess
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Console helpers are shared by all scripts (scripts/console_utils.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from console_utils import fix_console_encoding  # noqa: E402
+
+__all__ = [
+    "PYRIGHT_COMMAND",
+    "PYRIGHT_THREADS",
+    "RUFF_CHECK_COMMAND",
+    "RUFF_FIX_COMMAND",
+    "RUFF_FORMAT_COMMAND",
+    "fix_console_encoding",
+    "run_concurrently",
+    "run_ruff",
+]
+
+# Analyzer threads: leave one core free for the rest of the system
+PYRIGHT_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
+RUFF_CHECK_COMMAND = ("uv", "run", "ruff", "check", ".")
+# Fix stage: remaining violations are reported by the final check
+RUFF_FIX_COMMAND = ("uv", "run", "ruff", "check", "--fix", "--exit-zero", ".")
+RUFF_FORMAT_COMMAND = ("uv", "run", "ruff", "format", ".")
+# Multi-threaded analysis (pyright >= 1.1.380)
+PYRIGHT_COMMAND = ("uv", "run", "pyright", "--threads", str(PYRIGHT_THREADS), "src")
+
+
+def run_concurrently(
+    commands: Sequence[Sequence[str]],
+) -> list[subprocess.CompletedProcess[str]]:
+    """
+    Run commands at the same time and capture their output.
+
+    Args:
+        commands: Command lines to run
+
+    Returns:
+        Completed processes, in the same order as the commands
+    """
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        futures = [
+            executor.submit(subprocess.run, list(command), capture_output=True, text=True)
+            for command in commands
+        ]
+        return [future.result() for future in futures]
+
+
+def run_ruff() -> int:
+    """
+    Fix the code with ruff, format it, then verify the result.
+
+    Returns:
+        0 on success, 1 if a stage failed or manual fixes are required
+    """
+    # Run ruff check with --fix to automatically fix issues
+    print("🔍 Running ruff check --fix...")
+    if subprocess.run(RUFF_FIX_COMMAND, check=False).returncode != 0:
+        print("❌ Error during ruff check --fix")
+        return 1
+
+    # Format rewrites files in place: only check the tree once it finished
+    print("✨ Running ruff format...")
+    if subprocess.run(RUFF_FORMAT_COMMAND, check=False).returncode != 0:
+        print("❌ Error during ruff format")
+        return 1
+
+    print("🔍 Running final ruff check...")
+    check_final = subprocess.run(RUFF_CHECK_COMMAND, check=False, stdout=subprocess.PIPE, text=True)
+    if check_final.returncode != 0:
+        print("⚠️  Manual fixes required:")
+        print(check_final.stdout)
+        return 1
+
+    print("✅ Ruff corrections and formatting completed successfully.")
+    return 0
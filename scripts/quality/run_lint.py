@@ -0,0 +1,62 @@
+"""
+Lint entry point (Ruff + Pyright)
+
+Usage:
+    uv run python scripts/quality/run_lint.py
+
+This script runs the Ruff check and the Pyright type checker concurrently
+(Ruff and Pyright use different runtimes, so their work overlaps) and
+reports both results. It does not modify files: use run_ruff.py to fix
+and format the code.
+"""
+
+import sys
+
+from lint_core import (
+    PYRIGHT_COMMAND,
+    RUFF_CHECK_COMMAND,
+    fix_console_encoding,
+    run_concurrently,
+)
+
+# Fix for Windows console encoding (emojis)
+fix_console_encoding()
+
+
+def main():
+    """
+    Run Ruff and Pyright concurrently and report both results.
+    """
+    print("🔍 Running ruff check and Pyright...")
+    results = run_concurrently([RUFF_CHECK_COMMAND, PYRIGHT_COMMAND])
+
+    for name, result in zip(("Ruff", "Pyright"), results, strict=True):
+        print("=" * 70)
+        status = "✅" if result.returncode == 0 else "❌"
+        print(f"{status} {name}")
+        if result.stdout:
+            print(result.stdout)
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+
+    print("=" * 70)
+    return_code = max(result.returncode for result in results)
+    if return_code == 0:
+        print("✅ No lint or type errors found!")
+    else:
+        print("❌ Lint or type errors detected. Please review the output above.")
+    return return_code
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Operation cancelled by user")
+        sys.exit(130)
+    except Exception as e:
+        print(f"\n\n❌ Unexpected error: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
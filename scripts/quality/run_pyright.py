@@ -7,19 +7,13 @@ Usage:
 This script runs Pyright to detect type errors in the codebase.
 """
 
-import os
 import subprocess
 import sys
 
+from lint_core import PYRIGHT_COMMAND, fix_console_encoding
+
 # Fix for Windows console encoding (emojis)
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
+fix_console_encoding()
 
 
 def main():
@@ -29,28 +23,27 @@ def main():
     print("🔍 Running Pyright type checker...")
     print("=" * 70)
 
-    # Run pyright
-    result = subprocess.run(
-        ["uv", "run", "pyright", "src"],
-        capture_output=True,
+    # Run pyright, streaming its output as it is produced
+    with subprocess.Popen(
+        PYRIGHT_COMMAND,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
-    )
-
-    # Display output
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            sys.stdout.write(line)
 
     # Check result
-    if result.returncode == 0:
+    if process.returncode == 0:
         print("=" * 70)
         print("✅ No type errors found!")
         return 0
     else:
         print("=" * 70)
         print("❌ Type errors detected. Please review the output above.")
-        return result.returncode
+        return process.returncode
 
 
 if __name__ == "__main__":
@@ -2,26 +2,18 @@
 Test script to verify crash logging functionality
 """
 
-import os
-import subprocess
 import sys
 from pathlib import Path
 
-from src.core import setup_exception_handler, setup_root_logger
-
 # Add project root to path
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.core import setup_exception_handler, setup_root_logger  # noqa: E402
+from src.core.utils.console import fix_console_encoding  # noqa: E402
+
 # Fix for Windows console encoding (emojis)
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
+fix_console_encoding()
 
 
 # Setup logger and exception handler
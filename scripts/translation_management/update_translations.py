@@ -9,34 +9,113 @@ This script automates the complete translation workflow:
 1. Extract translatable strings from source code
 2. Update/initialize translation files (.po)
 3. Compile to binary format (.mo)
+
+All steps run in this process through Babel's command line interface, so
+Python and Babel are only started once. Extraction and catalog updates are
+skipped when no source file changed since the last run (translations/.extract_stamp).
 """
 
+import hashlib
 import os
-import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+from babel.messages.frontend import CommandLineInterface
+from babel.messages.mofile import write_mo
+from babel.messages.pofile import read_po
+
+# Console helpers are shared by all scripts (scripts/console_utils.py)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from console_utils import fix_console_encoding  # noqa: E402
+
 # Fix Unicode encoding for Windows console
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
-
-
-def run_command(cmd, description, project_root):
-    """Execute a command and handle errors"""
+fix_console_encoding()
+
+# Digest of the extraction inputs at the last successful extract + update
+EXTRACT_STAMP_NAME = ".extract_stamp"
+
+
+def compute_sources_digest(src_dir, config_file):
+    """Hash the path, mtime and size of every file read by pybabel extract"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in [config_file, *sorted(src_dir.rglob("*.py"))]:
+        file_stat = path.stat()
+        digest.update(f"{path}\0{file_stat.st_mtime_ns}\0{file_stat.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+def execute_babel(args):
+    """Run a pybabel command in-process, returning an error message or None"""
+    try:
+        # Returns the number of errors (compile) or None
+        errors = CommandLineInterface().run(["pybabel", *args])
+    except Exception as e:
+        return str(e)
+    return f"{errors} error(s)" if errors else None
+
+
+def read_template_messages(path):
+    """Read a .pot file without its POT-Creation-Date header (changes on every extract)"""
+    with open(path, "rb") as f:
+        return [line for line in f if not line.startswith(b'"POT-Creation-Date:')]
+
+
+def replace_if_changed(new_path, target_path):
+    """
+    Move a freshly extracted template over the current one if its messages changed.
+
+    Returns:
+        True if the template was replaced, False if it was already up to date
+    """
+    try:
+        unchanged = read_template_messages(new_path) == read_template_messages(target_path)
+    except FileNotFoundError:
+        unchanged = False
+
+    if unchanged:
+        os.unlink(new_path)
+        return False
+    os.replace(new_path, target_path)
+    return True
+
+
+def compile_catalog(po_path, mo_path, locale):
+    """Compile one .po catalog to .mo, returning an error message or None"""
+    try:
+        with open(po_path, "rb") as f:
+            catalog = read_po(f, locale)
+
+        # Same rule as pybabel compile: fuzzy catalogs are not compiled
+        if catalog.fuzzy:
+            print(f"⏭️  {locale}: catalog is marked as fuzzy, skipping")
+            return None
+
+        errors = [f"{message.id!r}: {error}" for message, errs in catalog.check() for error in errs]
+        if errors:
+            return "; ".join(errors)
+
+        with open(mo_path, "wb") as f:
+            write_mo(f, catalog)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def print_step(description):
+    """Print a step header"""
     print(f"\n{'=' * 70}")
     print(f"▶️  {description}")
     print(f"{'=' * 70}\n")
 
-    result = subprocess.run(cmd, shell=True, cwd=str(project_root))
 
-    if result.returncode != 0:
-        print(f"\n❌ Error during: {description}")
+def run_babel(args, description):
+    """Run a pybabel command in-process and handle errors"""
+    print_step(description)
+
+    error = execute_babel(args)
+    if error:
+        print(f"\n❌ Error during: {description} ({error})")
         sys.exit(1)
 
     print(f"\n✅ {description} - OK\n")
@@ -52,11 +131,31 @@ def main():
     print("🌐 UPDATING TRANSLATIONS WITH BABEL")
     print("=" * 70 + "\n")
 
-    # Step 1: Extract
-    extract_cmd = (
-        f'uv run pybabel extract -F babel.cfg -k _ -o "{translations_dir}/template.pot" "{src_dir}"'
-    )
-    run_command(extract_cmd, "🔍 Extracting translatable texts", project_root)
+    # Babel resolves babel.cfg and source locations from the working directory
+    os.chdir(project_root)
+    template_path = str(translations_dir / "template.pot")
+
+    # Step 1: Extract (skipped when the sources match the last extraction)
+    stamp_path = translations_dir / EXTRACT_STAMP_NAME
+    sources_digest = compute_sources_digest(src_dir, project_root / "babel.cfg")
+    try:
+        sources_unchanged = (
+            Path(template_path).exists() and stamp_path.read_text().strip() == sources_digest
+        )
+    except OSError:
+        sources_unchanged = False
+
+    if sources_unchanged:
+        print("⏭️  Sources unchanged since the last extraction: template.pot is up to date")
+        template_changed = False
+    else:
+        # Extract next to the template, only replace it if the messages changed
+        template_tmp = f"{template_path}.tmp"
+        extract_args = ["extract", "-F", "babel.cfg", "-k", "_", "-o", template_tmp, str(src_dir)]
+        run_babel(extract_args, "🔍 Extracting translatable texts")
+        template_changed = replace_if_changed(template_tmp, template_path)
+        if not template_changed:
+            print("⏭️  Extracted messages unchanged: template.pot is up to date")
 
     # Step 2: Update/Initialize languages
     # Read available languages from config.json
@@ -75,27 +174,55 @@ def main():
 
     domain = "writing_assistant"
 
+    jobs = []
     for lang in languages:
         po_file = translations_dir / lang / "LC_MESSAGES" / f"{domain}.po"
 
+        catalog_args = ["-d", str(translations_dir), "-i", template_path, "-l", lang, "-D", domain]
         if po_file.exists():
-            # Update existing language
-            update_cmd = (
-                f'uv run pybabel update -d "{translations_dir}" '
-                f'-i "{translations_dir}/template.pot" -l {lang} -D {domain}'
-            )
-            run_command(update_cmd, f"🔄 Updating {lang.upper()} translations", project_root)
+            # Update existing language (nothing to merge if the template did not change)
+            if template_changed:
+                jobs.append((["update", *catalog_args], f"🔄 Updating {lang.upper()} translations"))
         else:
             # Initialize new language
-            init_cmd = (
-                f'uv run pybabel init -d "{translations_dir}" '
-                f'-i "{translations_dir}/template.pot" -l {lang} -D {domain}'
+            jobs.append((["init", *catalog_args], f"✨ Initializing {lang.upper()} language"))
+
+    # Each language writes its own catalog: update them concurrently,
+    # then report in language order
+    if jobs:
+        print_step(f"🔄 Updating {len(jobs)} languages")
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            errors = list(executor.map(execute_babel, [args for args, _ in jobs]))
+
+        for (_, description), error in zip(jobs, errors, strict=True):
+            if error:
+                print(f"\n❌ Error during: {description} ({error})")
+                sys.exit(1)
+            print(f"✅ {description} - OK")
+
+    # Only record the stamp once extract and update both succeeded
+    if not sources_unchanged:
+        stamp_path.write_text(sources_digest)
+
+    # Step 3: Compile every catalog of the domain, one process per language
+    print_step("⚙️  Compiling translations (.po → .mo)")
+    po_files = sorted(translations_dir.glob(f"*/LC_MESSAGES/{domain}.po"))
+    locales = [po_file.parent.parent.name for po_file in po_files]
+    with ProcessPoolExecutor(max_workers=max(1, len(po_files))) as executor:
+        errors = list(
+            executor.map(
+                compile_catalog,
+                po_files,
+                [po_file.with_suffix(".mo") for po_file in po_files],
+                locales,
             )
-            run_command(init_cmd, f"✨ Initializing {lang.upper()} language", project_root)
+        )
 
-    # Step 3: Compile
-    compile_cmd = f'uv run pybabel compile -d "{translations_dir}" -D writing_assistant'
-    run_command(compile_cmd, "⚙️  Compiling translations (.po → .mo)", project_root)
+    for locale, error in zip(locales, errors, strict=True):
+        if error:
+            print(f"\n❌ Error compiling {locale.upper()}: {error}")
+            sys.exit(1)
+    print(f"✅ Compiled {len(po_files)} catalogs - OK")
 
     print("\n" + "=" * 70)
     print("✅ TRANSLATIONS UPDATED SUCCESSFULLY!")
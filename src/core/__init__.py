@@ -13,31 +13,67 @@ This package contains the core functionality modules including:
 
 from __future__ import annotations
 
-# Import config system
-from .config.manager import ConfigManager, parse_arguments
-
-# Import hotkey management system
-from .managers.hotkey import HotkeyManager
-
-# Import systray management system
-from .managers.systray import SystrayManager
-
-# Import window manager system
-from .managers.window import WindowManager
-
-# Import logger system
-from .services.logger import setup_exception_handler, setup_root_logger
-
-# Import translation system
-from .services.translation import (
-    LanguageManager,
-    _,
-    change_language,
-    get_current_language,
-    get_language_manager,
-    init_translation,
-    register_ui_update,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config.manager import ConfigManager, parse_arguments
+    from .managers.hotkey import HotkeyManager
+    from .managers.systray import SystrayManager
+    from .managers.window import WindowManager
+    from .services.logger import setup_exception_handler, setup_root_logger
+    from .services.translation import (
+        LanguageManager,
+        _,
+        change_language,
+        get_current_language,
+        get_language_manager,
+        init_translation,
+        register_ui_update,
+    )
+
+# Public name -> submodule defining it. Submodules are imported on first
+# access (PEP 562), so `from src.core import parse_arguments` does not pull
+# in keyboard, pystray or Flet through the managers.
+_LAZY_EXPORTS = {
+    # Translation system
+    "LanguageManager": ".services.translation",
+    "get_language_manager": ".services.translation",
+    "init_translation": ".services.translation",
+    "_": ".services.translation",
+    "change_language": ".services.translation",
+    "get_current_language": ".services.translation",
+    "register_ui_update": ".services.translation",
+    # Logger system
+    "setup_root_logger": ".services.logger",
+    "setup_exception_handler": ".services.logger",
+    # Config system
+    "parse_arguments": ".config.manager",
+    "ConfigManager": ".config.manager",
+    # Hotkey management system
+    "HotkeyManager": ".managers.hotkey",
+    # Systray management system
+    "SystrayManager": ".managers.systray",
+    # Window manager system
+    "WindowManager": ".managers.window",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazy exports alongside the already loaded names"""
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     # Translation system
@@ -5,7 +5,11 @@ Centralized configuration management with JSON persistence
 
 from __future__ import annotations
 
+import sys
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 from loguru import logger
@@ -22,11 +26,26 @@ def load_default_config() -> dict[str, Any]:
 
 DEFAULT_CONFIG = load_default_config()
 
+# Quiet period (seconds) after the last change before the file is written
+SAVE_DEBOUNCE_DELAY = 0.25
+
+# Previous default values (key -> value) replaced by the current default when
+# found in a saved configuration, so existing setups get the new default
+MIGRATED_DEFAULTS: dict[str, Any] = {
+    "min_trigger_interval": 0.5,  # Hotkey debounce, now 0.05s
+}
+
 
 class ConfigManager:
     """
     Manages application configuration with JSON file persistence.
     Supports attribute-style access for backward compatibility.
+
+    Changes are written once SAVE_DEBOUNCE_DELAY seconds have passed without
+    another change, so a burst of assignments costs a single write. A single
+    save thread runs while changes are pending; it is not a daemon, so a
+    normal exit still writes them, flush() writes them right away (e.g.
+    before os._exit).
     """
 
     def __init__(self, config_file: str = "config.json"):
@@ -45,6 +64,15 @@ class ConfigManager:
             self._config_file = self.app_root / config_file
 
         self._config: dict[str, Any] = DEFAULT_CONFIG.copy()
+        # Attribute name (DEBUG or debug) -> configuration key
+        self._attr_map: dict[str, str] = {}
+        # _save_lock guards _config and the pending save state; _write_lock
+        # orders the file writes (a newer snapshot is never overwritten)
+        self._dirty = False
+        self._save_deadline = 0.0
+        self._save_thread: threading.Thread | None = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self.load()
 
     def load(self) -> None:
@@ -56,31 +84,92 @@ class ConfigManager:
                 # preserves new keys in default)
                 self._config.update(saved_config)
                 self.log.info(f"Configuration loaded from {self._config_file} (Mode: {self.mode})")
+                self._migrate_defaults(saved_config)
         else:
             self.log.info(f"No configuration file found at {self._config_file}, using defaults")
             self.save()
 
+        # The saved file may add keys
+        self._rebuild_attr_map()
+
+    def _migrate_defaults(self, saved_config: dict[str, Any]) -> None:
+        """Replace outdated default values kept by a saved configuration."""
+        migrated = [
+            key
+            for key, old_default in MIGRATED_DEFAULTS.items()
+            if key in DEFAULT_CONFIG and saved_config.get(key) == old_default
+        ]
+        if not migrated:
+            return
+        for key in migrated:
+            self._config[key] = DEFAULT_CONFIG[key]
+        self.log.info(f"Configuration defaults updated: {', '.join(migrated)}")
+        self.save()
+
+    def _rebuild_attr_map(self) -> None:
+        """Map both attribute spellings of every key, computed once per key set."""
+        self._attr_map = {name: key for key in self._config for name in (key.upper(), key)}
+
     def save(self) -> None:
         """Save current configuration to JSON file."""
-        save_json_file(self._config_file, self._config)
+        with self._write_lock:
+            # Serialize a snapshot: set() may change the dict during the write
+            with self._save_lock:
+                data = dict(self._config)
+                self._dirty = False
+            save_json_file(self._config_file, data)
         self.log.info(f"Configuration saved to {self._config_file}")
 
+    def flush(self) -> None:
+        """Write pending changes now instead of waiting for the debounce delay."""
+        with self._save_lock:
+            pending = self._dirty
+        if pending:
+            self.save()
+
+    def _save_when_quiet(self) -> None:
+        """Save thread: write once no change happened for SAVE_DEBOUNCE_DELAY."""
+        while True:
+            with self._save_lock:
+                if not self._dirty:
+                    # Saved (here or by flush): the next set() starts a new thread
+                    self._save_thread = None
+                    return
+                remaining = self._save_deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                self.save()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self._config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value and save."""
-        self._config[key] = value
-        self.save()
+        """Set a configuration value and schedule a save."""
+        with self._save_lock:
+            is_new_key = key not in self._config
+            self._config[key] = value
+            if is_new_key:
+                self._rebuild_attr_map()
+            self._dirty = True
+            # Restart the quiet period: only the last change of a burst saves
+            self._save_deadline = time.monotonic() + SAVE_DEBOUNCE_DELAY
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_when_quiet, name="ConfigSave"
+                )
+                self._save_thread.start()
 
     def __getattr__(self, name: str) -> Any:
         """
         Allow attribute-style access to configuration keys (uppercase).
         Example: config.DEBUG -> config.get('debug')
         """
-        key = name.lower()
-        if key in self._config:
+        # Private attributes are never configuration keys (also guards the
+        # lookups made before __init__ has set _attr_map)
+        key = None if name.startswith("_") else self._attr_map.get(name)
+        if key is not None:
             return self._config[key]
         raise AttributeError(f"'ConfigManager' object has no attribute '{name}'")
 
@@ -101,25 +190,43 @@ class ConfigManager:
             super().__setattr__(name, value)
             return
 
-        key = name.lower()
-        if key in self._config:
+        key = self._attr_map.get(name)
+        if key is not None:
             self.set(key, value)
         else:
             super().__setattr__(name, value)
 
 
-def parse_arguments():
+def parse_arguments(argv: list[str] | None = None) -> SimpleNamespace:
     """
     Parse command line arguments for the application.
+
+    Only --debug and --log-file are needed at startup, so sys.argv is scanned
+    directly; argparse is only imported to answer -h/--help. Unknown arguments
+    are ignored (Flet may pass extra args).
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
     Returns:
-        argparse.Namespace: Parsed command line arguments
+        SimpleNamespace: Parsed arguments (debug, log_file)
     """
-    import argparse
-
-    parser = argparse.ArgumentParser(description="Writing Assistant Pro")
-    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
-    parser.add_argument("--log-file", type=str, help="Custom log filename")
-    # Use parse_known_args to allow unknown arguments (
-    # Flet may pass extra args)
-    args, _ = parser.parse_known_args()
-    return args
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if "-h" in argv or "--help" in argv:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Writing Assistant Pro")
+        parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+        parser.add_argument("--log-file", type=str, help="Custom log filename")
+        parser.parse_known_args(argv)
+
+    log_file = None
+    for index, arg in enumerate(argv):
+        if arg == "--log-file" and index + 1 < len(argv):
+            log_file = argv[index + 1]
+        elif arg.startswith("--log-file="):
+            log_file = arg.split("=", 1)[1]
+
+    return SimpleNamespace(debug="--debug" in argv, log_file=log_file)
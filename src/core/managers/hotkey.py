@@ -5,19 +5,22 @@ Handles global hotkey registration and management
 
 from __future__ import annotations
 
-import threading
 import time
 
 import keyboard
 from loguru import logger
 
+from ..services.native_hotkey import create_native_listener
+
 
 class HotkeyManager:
     """
     Manages global hotkey registration and lifecycle
 
-    Handles hotkey registration with optional delay to avoid startup conflicts,
-    and proper cleanup of keyboard hooks.
+    Registers the hotkey natively with the OS when possible (Win32
+    RegisterHotKey, X11 XGrabKey), falling back to the keyboard library
+    hooks otherwise.
+    Handles registration and proper cleanup of keyboard hooks.
     """
 
     def __init__(self, config):
@@ -25,12 +28,12 @@ class HotkeyManager:
         Initialize HotkeyManager
 
         Args:
-            config: Configuration object with HOTKEY_COMBINATION and HOTKEY_SETUP_DELAY
+            config: Configuration object with HOTKEY_COMBINATION
         """
         self.config = config
         self.log = logger.bind(name="WritingAssistant.HotkeyManager")
         self._hotkey_hook = None
-        self._setup_thread = None
+        self._native_listener = None
         self._toggle_callback = None
 
     def register(self, toggle_callback):
@@ -52,6 +55,22 @@ class HotkeyManager:
             return False
 
         try:
+            # Release any previous registration (native or hook) to prevent duplicates
+            self._release_registration()
+
+            # Prefer native OS registration (no global keyboard hook)
+            listener = create_native_listener(hotkey, toggle_callback)
+            if listener:
+                if listener.start():
+                    self._native_listener = listener
+                    self._toggle_callback = toggle_callback
+                    self.log.info(f"Global hotkey registered natively: {hotkey} (toggle window)")
+                    return True
+                # A timed out start can still register later: stop the thread
+                # so the hotkey is not also handled by the keyboard hook
+                listener.stop()
+                self.log.warning("Native hotkey registration failed, using keyboard hooks")
+
             # Clear all existing hotkeys first to prevent duplicates
             self.log.debug("Clearing all existing keyboard hooks...")
             keyboard.unhook_all()
@@ -60,7 +79,7 @@ class HotkeyManager:
             # Register new hotkey
             self._toggle_callback = toggle_callback
             self.log.debug(f"Adding hotkey: {hotkey} (suppress=False)")
-            keyboard.add_hotkey(hotkey, toggle_callback, suppress=False)
+            keyboard.add_hotkey(hotkey, self._debounced(toggle_callback), suppress=False)
 
             self._hotkey_hook = hotkey
             self.log.info(f"Global hotkey registered: {hotkey} (toggle window)")
@@ -68,34 +87,33 @@ class HotkeyManager:
 
         except Exception as e:
             self.log.error(f"Failed to register hotkey: {e}")
-            import traceback
-
-            self.log.error(f"Traceback: {traceback.format_exc()}")
+            self.log.opt(exception=True).error("Traceback")
             return False
 
-    def register_delayed(self, toggle_callback):
+    def _debounced(self, callback):
         """
-        Register global hotkey with delay to avoid startup conflicts
+        Wrap a keyboard hook callback to absorb key repeat.
 
-        Args:
-            toggle_callback: Function to call when hotkey is pressed
+        The keyboard library calls back on every auto-repeated press, unlike
+        the native listeners. Leading edge: the first press runs immediately,
+        presses within MIN_TRIGGER_INTERVAL of the last accepted one are dropped.
         """
-
-        def delayed_setup():
-            self.log.info(f"Waiting {self.config.HOTKEY_SETUP_DELAY}s before registering hotkey...")
-            time.sleep(self.config.HOTKEY_SETUP_DELAY)
-            self.log.info(f"Attempting to register hotkey: {self.config.HOTKEY_COMBINATION}")
-            success = self.register(toggle_callback)
-            if success:
-                self.log.info(
-                    f"✓ Hotkey ready! Press {self.config.HOTKEY_COMBINATION} to toggle window"
-                )
-            else:
-                self.log.error("✗ Failed to setup hotkey - please check logs")
-
-        self._setup_thread = threading.Thread(target=delayed_setup, daemon=True)
-        self._setup_thread.start()
-        self.log.debug("Hotkey registration thread started")
+        # Read once per registration, not on every key press
+        min_interval = float(self.config.MIN_TRIGGER_INTERVAL)
+        last_trigger_time = float("-inf")
+
+        def debounced_callback():
+            nonlocal last_trigger_time
+            # Monotonic clock: wall clock adjustments cannot swallow a press
+            current_time = time.monotonic()
+            time_since_last = current_time - last_trigger_time
+            if time_since_last < min_interval:
+                self.log.debug("Ignoring hotkey - too soon ({:.2f}s)", time_since_last)
+                return
+            last_trigger_time = current_time
+            callback()
+
+        return debounced_callback
 
     def unregister(self):
         """
@@ -105,13 +123,12 @@ class HotkeyManager:
             bool: True if successful, False otherwise
         """
         try:
-            if self._hotkey_hook:
-                keyboard.remove_hotkey(self._hotkey_hook)
-                self.log.info(f"Hotkey unregistered: {self._hotkey_hook}")
-                self._hotkey_hook = None
-                self._toggle_callback = None
-                return True
-            return False
+            registered = self._native_listener is not None or self._hotkey_hook is not None
+            self._release_registration()
+            self._toggle_callback = None
+            if registered:
+                self.log.info("Hotkey unregistered")
+            return registered
         except Exception as e:
             self.log.error(f"Failed to unregister hotkey: {e}")
             return False
@@ -121,9 +138,28 @@ class HotkeyManager:
         Full cleanup of all hotkey resources
         """
         try:
-            keyboard.unhook_all()
+            self._stop_native_listener()
+            if self._hotkey_hook:
+                keyboard.unhook_all()
             self._hotkey_hook = None
             self._toggle_callback = None
             self.log.debug("HotkeyManager cleaned up")
         except Exception as e:
             self.log.debug(f"HotkeyManager cleanup error: {e}")
+
+    def _stop_native_listener(self):
+        """
+        Stop the native hotkey listener if one is running
+        """
+        if self._native_listener:
+            self._native_listener.stop()
+            self._native_listener = None
+
+    def _release_registration(self):
+        """
+        Release the current hotkey, whether native or a keyboard hook
+        """
+        self._stop_native_listener()
+        if self._hotkey_hook:
+            hook, self._hotkey_hook = self._hotkey_hook, None
+            keyboard.remove_hotkey(hook)
@@ -229,6 +229,10 @@ class SystrayManager:
             logger.info("Cleaning up hotkey manager...")
             self.app.hotkey_manager.cleanup()
 
+        # Write pending settings now: os._exit below skips the save timer
+        if self.app and hasattr(self.app, "config"):
+            self.app.config.flush()
+
         # Hide Flet window if it exists to avoid orphaned process
         try:
             if self.page and self.page.window:
@@ -5,9 +5,6 @@ Handles window visibility, hotkeys, and window lifecycle
 
 from __future__ import annotations
 
-import threading
-import time
-
 from loguru import logger
 
 
@@ -20,8 +17,6 @@ class WindowManager:
         self.config = config
         self.page = page  # Flet page reference
         self.log = logger.bind(name="WritingAssistant.WindowManager")
-        self.last_trigger_time = 0.0
-        self.trigger_lock = threading.Lock()  # Prevent overlapping triggers
         self.window_visible = False
 
     def set_page(self, page):
@@ -29,25 +24,15 @@ class WindowManager:
         self.page = page
 
     def toggle_window(self) -> None:
-        """Toggle window visibility on hotkey press"""
-        # Try to acquire lock without blocking
-        if not self.trigger_lock.acquire(blocking=False):
-            self.log.debug("Hotkey already processing, ignoring")
-            return
+        """
+        Toggle window visibility on hotkey press
 
+        Key repeat is absorbed before this is called: the native listeners
+        only report the first press, HotkeyManager debounces keyboard hooks.
+        """
         try:
-            current_time = time.time()
-
-            # Debounce check
-            time_since_last = current_time - self.last_trigger_time
-            if time_since_last < self.config.MIN_TRIGGER_INTERVAL:
-                self.log.debug(f"Ignoring hotkey - too soon ({time_since_last:.2f}s)")
-                return
-
-            self.last_trigger_time = current_time
-
             # Simple toggle based on current state
-            self.log.info(f"Toggle window - current state: visible={self.window_visible}")
+            self.log.info("Toggle window - current state: visible={}", self.window_visible)
 
             if self.window_visible:
                 self.hide_window()
@@ -56,8 +41,6 @@ class WindowManager:
 
         except Exception as e:
             self.log.error(f"Error in toggle_window: {e}")
-        finally:
-            self.trigger_lock.release()
 
     def show_window(self) -> None:
         """Show the native window"""
@@ -77,9 +60,8 @@ class WindowManager:
 
         except Exception as e:
             self.log.error(f"Error showing window: {e}")
-            import traceback
-
-            self.log.debug(f"Full traceback: {traceback.format_exc()}")
+            # loguru only formats the traceback if the DEBUG record is emitted
+            self.log.opt(exception=True).debug("Full traceback")
 
     def hide_window(self) -> None:
         """Hide the native window"""
@@ -7,23 +7,15 @@ across different keyboard layouts (AZERTY, QWERTY, etc.)
 
 from __future__ import annotations
 
-import os
-import subprocess
-import sys
 from collections.abc import Callable
 
 import keyboard
 from loguru import logger
 
+from ..utils.console import fix_console_encoding
+
 # Fix for Windows console encoding (emojis)
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
+fix_console_encoding()
 
 # Modifier keys that should be handled specially
 # Includes English names and French AZERTY names (maj = shift)
@@ -178,7 +170,7 @@ class HotkeyCapture:
 
         self._is_capturing = False
         result = self.get_current_hotkey()
-        self.log.debug(f"Stopped keyboard capture, result: {result}")
+        self.log.debug("Stopped keyboard capture, result: {}", result)
 
         # Clear state
         self._current_keys.clear()
@@ -197,25 +189,25 @@ class HotkeyCapture:
 
         if event.event_type == "down":
             is_mod = self._is_modifier(key_name)
-            self.log.debug(f"Key DOWN: '{key_name}' (scan={event.scan_code}, is_mod={is_mod})")
+            self.log.debug("Key DOWN: '{}' (scan={}, is_mod={})", key_name, event.scan_code, is_mod)
 
             # Determine if this is a modifier or main key
             if is_mod:
                 # Normalize modifier name
                 normalized = self._normalize_modifier(key_name)
                 self._modifiers.add(normalized)
-                self.log.debug(f"  -> Modifier added: {normalized}, mods={self._modifiers}")
+                self.log.debug("  -> Modifier added: {}, mods={}", normalized, self._modifiers)
             else:
                 # This is the main key (non-modifier)
                 # Use scancode lookup first to get base key name (bypasses Shift for numpad)
                 scancode = event.scan_code
                 if scancode in SCANCODE_TO_KEY_NAME:
                     self._main_key = SCANCODE_TO_KEY_NAME[scancode]
-                    self.log.debug(f"  -> Main key (scancode {scancode}): {self._main_key}")
+                    self.log.debug("  -> Main key (scancode {}): {}", scancode, self._main_key)
                 else:
                     # Fallback to key name (may be shifted on regular keyboard)
                     self._main_key = self._normalize_key_name(key_name)
-                    self.log.debug(f"  -> Main key (name): {self._main_key}")
+                    self.log.debug("  -> Main key (name): {}", self._main_key)
 
             self._current_keys.add(key_name)
 
@@ -224,7 +216,7 @@ class HotkeyCapture:
                 self._on_update(self.get_display_hotkey())
 
         elif event.event_type == "up":
-            self.log.debug(f"Key UP: '{key_name}'")
+            self.log.debug("Key UP: '{}'", key_name)
             self._current_keys.discard(key_name)
 
             # Also remove from modifiers if it was a modifier
@@ -14,16 +14,25 @@ from types import TracebackType
 
 from loguru import logger
 
+# Arguments of the last setup_root_logger() call (None = not configured yet)
+_root_logger_config: tuple[bool, str | None] | None = None
+
 
 def setup_root_logger(debug: bool, log_filename: str | None = None) -> None:
     """
     Configure the root logger for the entire application using loguru.
-    Call this ONCE at application startup.
+    Call this ONCE at application startup; repeated calls with the same
+    arguments are ignored so handlers are never installed twice.
 
     Args:
         debug: True to enable DEBUG mode (logs), False for minimal logs
         log_filename: Optional custom filename for the log file
     """
+    global _root_logger_config
+    if _root_logger_config == (debug, log_filename):
+        return
+    _root_logger_config = (debug, log_filename)
+
     # Remove default handler (console output)
     logger.remove()
 
@@ -0,0 +1,463 @@
+"""
+Native global hotkey service for Writing Assistant Pro
+
+Registers the global hotkey directly with the operating system (Win32
+RegisterHotKey, X11 XGrabKey) instead of installing a low-level keyboard
+hook, so the process is only woken up when the registered combination is
+pressed.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import sys
+import threading
+from collections.abc import Callable
+
+from loguru import logger
+
+# Win32 modifier flags (RegisterHotKey)
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000  # Holding the keys does not repeat WM_HOTKEY
+
+# Win32 messages
+WM_QUIT = 0x0012
+WM_HOTKEY = 0x0312
+PM_NOREMOVE = 0x0000
+
+# Identifier of our hotkey (unique per thread)
+HOTKEY_ID = 1
+
+# Maximum time to wait for the listener thread to report registration
+REGISTRATION_TIMEOUT = 2.0
+
+# Storage format modifier name -> Win32 modifier flag
+WIN32_MODIFIERS = {
+    "ctrl": MOD_CONTROL,
+    "alt": MOD_ALT,
+    "shift": MOD_SHIFT,
+    "win": MOD_WIN,
+    "windows": MOD_WIN,
+}
+
+# Storage format key name -> Win32 virtual-key code
+# Names match the storage format produced by HotkeyCapture (lowercase)
+WIN32_VIRTUAL_KEYS = {
+    "space": 0x20,
+    "enter": 0x0D,
+    "tab": 0x09,
+    "escape": 0x1B,
+    "esc": 0x1B,
+    "backspace": 0x08,
+    "delete": 0x2E,
+    "insert": 0x2D,
+    "home": 0x24,
+    "end": 0x23,
+    "pageup": 0x21,
+    "pagedown": 0x22,
+    "left": 0x25,
+    "up": 0x26,
+    "right": 0x27,
+    "down": 0x28,
+    "printscreen": 0x2C,
+    "capslock": 0x14,
+    "scrolllock": 0x91,
+    "numlock": 0x90,
+    "nummultiply": 0x6A,
+    "numadd": 0x6B,
+    "numsubtract": 0x6D,
+    "decimal": 0x6E,
+    "numdivide": 0x6F,
+    **{f"num{digit}": 0x60 + digit for digit in range(10)},
+    **{f"f{number}": 0x70 + number - 1 for number in range(1, 25)},
+}
+
+# X11 modifier masks (X.h)
+X11_SHIFT_MASK = 1 << 0
+X11_LOCK_MASK = 1 << 1  # Caps Lock
+X11_CONTROL_MASK = 1 << 2
+X11_MOD1_MASK = 1 << 3  # Alt
+X11_MOD2_MASK = 1 << 4  # Num Lock
+X11_MOD4_MASK = 1 << 6  # Super (Windows key)
+
+# X11 event types of a key press and release (X.h)
+X11_KEY_PRESS = 2
+X11_KEY_RELEASE = 3
+
+# Lock states grabbed too: X11 only matches the exact modifier state, so
+# the hotkey must also work with Caps Lock and/or Num Lock on
+X11_IGNORED_MASKS = (0, X11_LOCK_MASK, X11_MOD2_MASK, X11_LOCK_MASK | X11_MOD2_MASK)
+
+# Storage format modifier name -> X11 modifier mask
+X11_MODIFIERS = {
+    "ctrl": X11_CONTROL_MASK,
+    "alt": X11_MOD1_MASK,
+    "shift": X11_SHIFT_MASK,
+    "win": X11_MOD4_MASK,
+    "windows": X11_MOD4_MASK,
+}
+
+# Storage format key name -> X11 keysym name
+X11_KEYSYMS = {
+    "space": "space",
+    "enter": "Return",
+    "tab": "Tab",
+    "escape": "Escape",
+    "esc": "Escape",
+    "backspace": "BackSpace",
+    "delete": "Delete",
+    "insert": "Insert",
+    "home": "Home",
+    "end": "End",
+    "pageup": "Prior",
+    "pagedown": "Next",
+    "left": "Left",
+    "up": "Up",
+    "right": "Right",
+    "down": "Down",
+    "printscreen": "Print",
+    "capslock": "Caps_Lock",
+    "scrolllock": "Scroll_Lock",
+    "numlock": "Num_Lock",
+    "nummultiply": "KP_Multiply",
+    "numadd": "KP_Add",
+    "numsubtract": "KP_Subtract",
+    "decimal": "KP_Decimal",
+    "numdivide": "KP_Divide",
+    **{f"num{digit}": f"KP_{digit}" for digit in range(10)},
+    **{f"f{number}": f"F{number}" for number in range(1, 25)},
+}
+
+
+def parse_win32_hotkey(hotkey: str) -> tuple[int, int] | None:
+    """
+    Convert a storage format hotkey to Win32 modifiers and virtual-key code.
+
+    Args:
+        hotkey: Hotkey in storage format (e.g., "ctrl+space")
+
+    Returns:
+        (modifiers, virtual_key) tuple, or None if the hotkey cannot be
+        expressed with RegisterHotKey
+    """
+    modifiers = 0
+    virtual_key: int | None = None
+
+    for part in hotkey.lower().split("+"):
+        part = part.strip()
+        if part in WIN32_MODIFIERS:
+            modifiers |= WIN32_MODIFIERS[part]
+        elif virtual_key is not None:
+            # Only one main key is supported
+            return None
+        elif part in WIN32_VIRTUAL_KEYS:
+            virtual_key = WIN32_VIRTUAL_KEYS[part]
+        elif len(part) == 1 and part.isascii() and part.isalnum():
+            virtual_key = ord(part.upper())
+        else:
+            return None
+
+    if virtual_key is None:
+        return None
+    return modifiers, virtual_key
+
+
+def parse_x11_hotkey(hotkey: str) -> tuple[int, str] | None:
+    """
+    Convert a storage format hotkey to an X11 modifier mask and keysym name.
+
+    Args:
+        hotkey: Hotkey in storage format (e.g., "ctrl+space")
+
+    Returns:
+        (modifiers, keysym_name) tuple, or None if the hotkey cannot be
+        expressed with XGrabKey
+    """
+    modifiers = 0
+    keysym_name: str | None = None
+
+    for part in hotkey.lower().split("+"):
+        part = part.strip()
+        if part in X11_MODIFIERS:
+            modifiers |= X11_MODIFIERS[part]
+        elif keysym_name is not None:
+            # Only one main key is supported
+            return None
+        elif part in X11_KEYSYMS:
+            keysym_name = X11_KEYSYMS[part]
+        elif len(part) == 1 and part.isascii() and part.isalnum():
+            keysym_name = part
+        else:
+            return None
+
+    if keysym_name is None:
+        return None
+    return modifiers, keysym_name
+
+
+class Win32HotkeyListener:
+    """
+    Listens for a global hotkey registered with Win32 RegisterHotKey.
+
+    RegisterHotKey binds the hotkey to the calling thread's message queue, so
+    registration, the GetMessageW loop and unregistration all happen in a
+    dedicated daemon thread.
+    """
+
+    def __init__(self, modifiers: int, virtual_key: int, callback: Callable[[], None]):
+        """
+        Initialize the listener.
+
+        Args:
+            modifiers: Win32 modifier flags (MOD_*)
+            virtual_key: Win32 virtual-key code of the main key
+            callback: Function to call when the hotkey is pressed
+        """
+        self.modifiers = modifiers
+        self.virtual_key = virtual_key
+        self.callback = callback
+        self.log = logger.bind(name="WritingAssistant.NativeHotkey")
+        self._thread: threading.Thread | None = None
+        self._thread_id: int | None = None
+        self._ready = threading.Event()
+        self._stop_requested = threading.Event()
+        self._registered = False
+
+    def start(self) -> bool:
+        """
+        Start the listener thread and register the hotkey.
+
+        Returns:
+            bool: True if the hotkey was registered, False otherwise
+        """
+        self._ready.clear()
+        self._stop_requested.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(REGISTRATION_TIMEOUT)
+        return self._registered
+
+    def stop(self) -> None:
+        """Stop the listener thread (unregisters the hotkey)."""
+        import ctypes
+
+        # Seen by a thread that has not registered yet (start() timed out)
+        self._stop_requested.set()
+        if self._thread_id is not None:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)  # type: ignore[attr-defined]
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        self._thread_id = None
+        self._registered = False
+
+    def _run(self) -> None:
+        """Register the hotkey and dispatch WM_HOTKEY messages."""
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        msg = wintypes.MSG()
+
+        # Force creation of the thread message queue so stop() can post WM_QUIT
+        user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+        self._thread_id = kernel32.GetCurrentThreadId()
+
+        modifiers = self.modifiers | MOD_NOREPEAT
+        if not user32.RegisterHotKey(None, HOTKEY_ID, modifiers, self.virtual_key):
+            self.log.error(f"RegisterHotKey failed (error {kernel32.GetLastError()})")
+            self._thread_id = None
+            self._ready.set()
+            return
+        if self._stop_requested.is_set():
+            # stop() may have run before _thread_id was set (no WM_QUIT posted)
+            user32.UnregisterHotKey(None, HOTKEY_ID)
+            self._thread_id = None
+            self._ready.set()
+            return
+
+        self._registered = True
+        self._ready.set()
+
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                    try:
+                        self.callback()
+                    except Exception as e:
+                        self.log.error("Error in hotkey callback: {}", e)
+        finally:
+            user32.UnregisterHotKey(None, HOTKEY_ID)
+            self._registered = False
+
+
+class X11HotkeyListener:
+    """
+    Listens for a global hotkey grabbed on the X11 root window (XGrabKey).
+
+    The listener opens its own display connection, used only by its daemon
+    thread. The thread sleeps in select() on that connection and a wake-up
+    pipe, so it only runs when the X server sends the grabbed key press.
+    """
+
+    def __init__(self, modifiers: int, keysym_name: str, callback: Callable[[], None]):
+        """
+        Initialize the listener.
+
+        Args:
+            modifiers: X11 modifier mask
+            keysym_name: X11 keysym name of the main key (e.g., "space")
+            callback: Function to call when the hotkey is pressed
+        """
+        self.modifiers = modifiers
+        self.keysym_name = keysym_name
+        self.callback = callback
+        self.log = logger.bind(name="WritingAssistant.NativeHotkey")
+        self._thread: threading.Thread | None = None
+        self._wake_fds: tuple[int, int] | None = None
+        self._ready = threading.Event()
+        self._registered = False
+
+    def start(self) -> bool:
+        """
+        Start the listener thread and grab the hotkey.
+
+        Returns:
+            bool: True if the hotkey was grabbed, False otherwise
+        """
+        self._ready.clear()
+        self._wake_fds = os.pipe()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(REGISTRATION_TIMEOUT)
+        return self._registered
+
+    def stop(self) -> None:
+        """Stop the listener thread (ungrabs the hotkey)."""
+        if self._wake_fds is not None:
+            try:
+                os.write(self._wake_fds[1], b"\0")
+            except OSError:
+                pass  # The thread already exited and closed the pipe
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        self._registered = False
+
+    def _run(self) -> None:
+        """Grab the hotkey and dispatch its key press events."""
+        assert self._wake_fds is not None
+        wake_read, wake_write = self._wake_fds
+        display = None
+        try:
+            from Xlib import XK, X, error
+            from Xlib.display import Display
+
+            display = Display()
+            root = display.screen().root
+            keycode = display.keysym_to_keycode(XK.string_to_keysym(self.keysym_name))
+            if not keycode:
+                self.log.error(f"No keycode for key '{self.keysym_name}'")
+                return
+
+            # Grab errors are reported asynchronously: sync to collect them
+            catch = error.CatchError(error.BadAccess)
+            for ignored in X11_IGNORED_MASKS:
+                root.grab_key(
+                    keycode,
+                    self.modifiers | ignored,
+                    True,
+                    X.GrabModeAsync,
+                    X.GrabModeAsync,
+                    onerror=catch,
+                )
+            display.sync()
+            if catch.get_error():
+                self.log.error("XGrabKey failed: hotkey already grabbed by another client")
+                return
+
+            self._registered = True
+            self._ready.set()
+
+            # Holding the keys repeats the press: the X server either sends
+            # presses only (detectable auto-repeat) or a release and a press
+            # with the same timestamp. Only the first press is reported
+            held = False
+            last_release_time = None
+            while True:
+                readable, _, _ = select.select([display.fileno(), wake_read], [], [])
+                if wake_read in readable:
+                    break
+                for _ in range(display.pending_events()):
+                    event = display.next_event()
+                    # Other events (e.g. MappingNotify after a layout change)
+                    # have no keycode
+                    if event.type not in (X11_KEY_PRESS, X11_KEY_RELEASE):
+                        continue
+                    if event.detail != keycode:
+                        continue
+                    if event.type == X11_KEY_RELEASE:
+                        held = False
+                        last_release_time = event.time
+                    elif event.type == X11_KEY_PRESS:
+                        repeated = held or event.time == last_release_time
+                        held = True
+                        if repeated:
+                            continue
+                        try:
+                            self.callback()
+                        except Exception as e:
+                            self.log.error("Error in hotkey callback: {}", e)
+
+            root.ungrab_key(keycode, X.AnyModifier)
+            display.sync()
+        except Exception as e:
+            self.log.error(f"X11 hotkey listener failed: {e}")
+        finally:
+            self._registered = False
+            self._ready.set()
+            if display is not None:
+                display.close()
+            os.close(wake_read)
+            os.close(wake_write)
+            self._wake_fds = None
+
+
+def create_native_listener(
+    hotkey: str, callback: Callable[[], None]
+) -> Win32HotkeyListener | X11HotkeyListener | None:
+    """
+    Create a native listener for the hotkey on the current platform.
+
+    Args:
+        hotkey: Hotkey in storage format (e.g., "ctrl+space")
+        callback: Function to call when the hotkey is pressed
+
+    Returns:
+        A listener ready to be started, or None if native registration is not
+        available for this platform or hotkey
+    """
+    if sys.platform.startswith("win"):
+        parsed = parse_win32_hotkey(hotkey)
+        if parsed is None:
+            return None
+        modifiers, virtual_key = parsed
+        return Win32HotkeyListener(modifiers, virtual_key, callback)
+
+    if sys.platform.startswith("linux") and os.environ.get("DISPLAY"):
+        try:
+            import Xlib  # noqa: F401  # python-xlib, installed with pystray on Linux
+        except ImportError:
+            return None
+        parsed = parse_x11_hotkey(hotkey)
+        if parsed is None:
+            return None
+        modifiers, keysym_name = parsed
+        return X11HotkeyListener(modifiers, keysym_name, callback)
+
+    return None
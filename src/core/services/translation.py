@@ -6,10 +6,110 @@ Provides internationalization support using gettext.
 from __future__ import annotations
 
 import gettext
+import hashlib
+import os
+import pickle
+import sys
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
-from ..utils.paths import get_app_root
+from ..utils.paths import get_app_root, get_cache_dir
+
+# Layout of the pickled (catalog, info) tuple: bump it when it changes
+CATALOG_CACHE_VERSION = 1
+
+
+class CachedTranslations(gettext.GNUTranslations):
+    """
+    GNUTranslations that can be rebuilt from a pickled catalog.
+
+    Parsing an MO file is a noticeable part of the startup time, so the parsed
+    catalog is stored in the user cache directory and reloaded with a single
+    pickle.load on the next launches.
+    """
+
+    _catalog: dict[Any, str]
+    _info: dict[str, str]
+    _charset: str | None
+
+    @classmethod
+    def from_catalog(cls, catalog: dict[Any, str], info: dict[str, str]) -> CachedTranslations:
+        """
+        Create a translation object from an already parsed catalog.
+
+        Args:
+            catalog: Mapping of msgid (or (msgid, n) for plurals) to msgstr
+            info: Metadata headers of the MO file
+
+        Returns:
+            Translation object equivalent to parsing the original MO file
+        """
+        translation = cls()
+        translation._catalog = catalog
+        translation._info = info
+        if "content-type" in info:
+            translation._charset = info["content-type"].split("charset=")[1]
+        if "plural-forms" in info:
+            plural = info["plural-forms"].split(";")[1].split("plural=")[1]
+            translation.plural = gettext.c2py(plural)
+        return translation
+
+
+def _get_catalog_cache_path(mo_path: Path) -> Path:
+    """
+    Get the cache file of an MO catalog.
+
+    The key includes the mtime and size of the MO file, so recompiling the
+    translations automatically invalidates the cached catalog, as well as the
+    interpreter version and CATALOG_CACHE_VERSION: a pickle written by
+    another Python (gettext) version is never loaded.
+    """
+    stat = mo_path.stat()
+    key = (
+        f"{mo_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+        f"|{sys.version}|{CATALOG_CACHE_VERSION}"
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return get_cache_dir() / "translations" / f"{digest}.pkl"
+
+
+def load_mo_catalog(mo_path: Path) -> CachedTranslations:
+    """
+    Load a compiled MO catalog, reusing the pickled copy when available.
+
+    Args:
+        mo_path: Path to the .mo file
+
+    Returns:
+        Loaded translation object
+    """
+    cache_path = _get_catalog_cache_path(mo_path)
+
+    try:
+        with open(cache_path, "rb") as f:
+            catalog, info = pickle.load(f)
+        return CachedTranslations.from_catalog(catalog, info)
+    except (pickle.UnpicklingError, EOFError, AttributeError, OSError):
+        # Missing or unreadable cache entry, parse the MO file below
+        pass
+
+    with open(mo_path, "rb") as f:
+        translation = CachedTranslations(f)
+
+    # Write the cache entry atomically, failures only cost the next startup
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                (translation._catalog, translation._info), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return translation
 
 
 class LanguageManager:
@@ -45,6 +145,9 @@ class LanguageManager:
         # Translation cache
         self._translations: dict[str, gettext.NullTranslations | gettext.GNUTranslations] = {}
 
+        # Lookup cache for the current language (text -> translated text)
+        self._lookup_cache: dict[str, str] = {}
+
         # UI update callbacks
         self._update_callbacks: list[Callable] = []
 
@@ -62,21 +165,16 @@ class LanguageManager:
             language = "en"  # Fallback to default
 
         self.current_language = language
+        self._lookup_cache.clear()
 
         # Set up gettext for this language
         try:
-            # Create locale path
-            locale_path = self.locales_dir / language / "LC_MESSAGES"
-
-            # Load translation
-            if locale_path.exists():
-                translation = gettext.translation(
-                    self.app_name,
-                    localedir=str(self.locales_dir),
-                    languages=[language],
-                    fallback=True,
-                )
-                self._translations[language] = translation
+            # Create MO file path
+            mo_path = self.locales_dir / language / "LC_MESSAGES" / f"{self.app_name}.mo"
+
+            # Load translation (from the catalog cache when up to date)
+            if mo_path.exists():
+                self._translations[language] = load_mo_catalog(mo_path)
             else:
                 # Create a simple fallback translation
                 self._translations[language] = gettext.NullTranslations()
@@ -103,9 +201,14 @@ class LanguageManager:
         Returns:
             Translated text
         """
-        if self.current_language in self._translations:
-            return self._translations[self.current_language].gettext(text)
-        return text
+        cached = self._lookup_cache.get(text)
+        if cached is not None:
+            return cached
+
+        translations = self._translations.get(self.current_language)
+        translated = translations.gettext(text) if translations else text
+        self._lookup_cache[text] = translated
+        return translated
 
     def get_language_name(self, language: str | None = None) -> str:
         """
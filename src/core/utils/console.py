@@ -0,0 +1,43 @@
+"""
+Console utilities for Writing Assistant Pro
+Makes the console accept UTF-8 output (emojis in log messages)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+# Set once the console has been configured in this process
+_console_fixed = False
+
+
+def fix_console_encoding() -> None:
+    """
+    Make the console accept UTF-8 output on all platforms.
+
+    The Windows console code pages are set directly with SetConsoleOutputCP
+    and SetConsoleCP instead of spawning `chcp 65001`. The code page belongs
+    to the console, so processes started from an already fixed console
+    (WAP_CONSOLE_FIXED set) skip that step. Safe to call from several
+    modules: only the first call does the work.
+    """
+    global _console_fixed
+    if _console_fixed:
+        return
+    _console_fixed = True
+
+    os.environ["PYTHONIOENCODING"] = "utf-8"
+    if os.name == "nt" and not os.environ.get("WAP_CONSOLE_FIXED"):
+        import ctypes
+
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)  # type: ignore[attr-defined]
+        ctypes.windll.kernel32.SetConsoleCP(65001)  # type: ignore[attr-defined]
+        os.environ["WAP_CONSOLE_FIXED"] = "1"
+
+    # Streams are None in windowed mode (no console)
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding="utf-8")  # type: ignore[union-attr]
+        except AttributeError:
+            pass
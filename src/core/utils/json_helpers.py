@@ -11,6 +11,11 @@ from typing import Any
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib json module is used instead
+    orjson = None
+
 
 def load_json_file(path: Path, default: Any = None) -> Any:
     """
@@ -27,6 +32,9 @@ def load_json_file(path: Path, default: Any = None) -> Any:
         return default
 
     try:
+        # orjson parses the raw bytes directly (no decode to str)
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with open(path, encoding="utf-8") as f:
             return json.load(f)
     except Exception as e:
@@ -47,6 +55,8 @@ def save_json_file(path: Path, data: Any) -> None:
         # Ensure directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Always the stdlib json: orjson only supports a 2-space indent and
+        # the on-disk layout must not depend on an optional dependency
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
     except Exception as e:
@@ -5,16 +5,17 @@ Handles application root detection and mode determination
 
 from __future__ import annotations
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Global constants for paths
-APP_ROOT = Path(__file__).parent.parent.parent.parent  # src/core/utils -> project root
-
 
+@lru_cache(maxsize=1)
 def get_mode() -> str:
     """
     Detect the running mode of the application.
+    Memoized: the mode cannot change while the process runs.
     Returns:
         str: "dev", "build-dev", or "build-final"
     """
@@ -33,9 +34,11 @@ def get_mode() -> str:
     return "dev"
 
 
+@lru_cache(maxsize=1)
 def get_app_root() -> Path:
     """
     Get the application root directory based on running mode.
+    Memoized: resolved once per process.
 
     Returns:
         Path: The base directory for resolving external resources (
@@ -47,7 +50,7 @@ def get_app_root() -> Path:
         # In dev mode, return project root
         # Static assets (styles, translations) are in source tree
         # Config will be in dist/dev (handled by ConfigManager)
-        return APP_ROOT
+        return Path(__file__).parent.parent.parent.parent  # src/core/utils -> project root
 
     else:
         # In frozen modes (build-dev, build-final)
@@ -55,3 +58,21 @@ def get_app_root() -> Path:
         # External files are also in dist/dev/
         # So app_root is the same as exe parent directory
         return Path(sys.executable).parent
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the per-user cache directory of the application.
+
+    Returns:
+        Path: %LOCALAPPDATA%/WritingAssistantPro/cache on Windows,
+        $XDG_CACHE_HOME/WritingAssistantPro (default ~/.cache) elsewhere
+    """
+    if sys.platform.startswith("win"):
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        base = Path(local_app_data) if local_app_data else Path.home() / "AppData" / "Local"
+        return base / "WritingAssistantPro" / "cache"
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "WritingAssistantPro"
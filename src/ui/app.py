@@ -10,6 +10,7 @@ from loguru import logger
 from src.core import (
     ConfigManager,
     HotkeyManager,
+    SystrayManager,
     WindowManager,
     _,
     change_language,
@@ -17,7 +18,6 @@ from src.core import (
     get_language_manager,
     init_translation,
 )
-from src.core.managers.systray import SystrayManager
 from src.core.services.hotkey_capture import format_hotkey_for_display
 from src.ui.components import (
     create_navigation_rail,
@@ -47,6 +47,13 @@ class WritingAssistantFletApp:
         # Store version
         self.version = version
 
+        # Window title, computed once (DEBUG does not change while running)
+        self.window_title = (
+            f"🔥 Writing Assistant Pro v{self.version} (DEV MODE)"
+            if self.config.DEBUG
+            else f"Writing Assistant Pro v{self.version}"
+        )
+
         # Get logger instance (logging already configured in main.py)
         self.log = logger.bind(name="WritingAssistant.FletApp")
 
@@ -80,22 +87,25 @@ class WritingAssistantFletApp:
         self.window_manager = WindowManager(self.config, page)
 
         # Page configuration
-        page.title = (
-            f"🔥 Writing Assistant Pro v{self.version} (DEV MODE)"
-            if self.config.DEBUG
-            else f"Writing Assistant Pro v{self.version}"
-        )
-        page.window.width = 800
-        page.window.height = 600
+        page.title = self.window_title
         page.theme_mode = ft.ThemeMode.DARK if self.config.DARK_MODE else ft.ThemeMode.LIGHT
         page.padding = 0
 
+        # Window options from config, all sent with the first page.update()
+        # Start hidden in the systray unless configured otherwise (main.py
+        # already created the native window hidden, so it never flashes)
+        start_visible = not self.config.WINDOW_START_HIDDEN
+        width, height = self.config.WINDOW_SIZE
+        window = page.window
+        window.width = width
+        window.height = height
+        window.resizable = self.config.WINDOW_RESIZABLE
+        window.frameless = self.config.WINDOW_FRAMELESS
+        window.visible = start_visible
         # Prevent app from closing when window is closed (hide instead)
-        page.window.prevent_close = True
-        page.window.on_event = self.on_window_event
-
-        # Hide window on start (systray mode)
-        page.window.visible = False
+        window.prevent_close = True
+        window.on_event = self.on_window_event
+        self.window_manager.window_visible = start_visible
 
         # No AppBar - using floating buttons and navigation rail instead
 
@@ -103,8 +113,10 @@ class WritingAssistantFletApp:
         self._create_ui()
 
         # Setup hotkey for toggle with logging
+        # Registered right away: the WindowManager already holds the page, so
+        # the hotkey can be honoured as soon as it is pressed
         self.log.info(f"Registering hotkey: {self.config.HOTKEY_COMBINATION}")
-        self.hotkey_manager.register_delayed(self.window_manager.toggle_window)
+        self.hotkey_manager.register(self.window_manager.toggle_window)
 
         # Initialize and start systray
         self.systray_manager = SystrayManager(page, on_about=self.show_about, app=self)
@@ -410,7 +422,7 @@ class WritingAssistantFletApp:
             # Re-register the original hotkey (was unregistered when dialog opened)
             if self.config.HOTKEY_COMBINATION and self.window_manager:
                 self.log.info("Cancel: re-registering original hotkey")
-                self.hotkey_manager.register_delayed(self.window_manager.toggle_window)
+                self.hotkey_manager.register(self.window_manager.toggle_window)
             return
 
         if result.action == "save":
@@ -418,7 +430,7 @@ class WritingAssistantFletApp:
         else:
             # Unknown action, just re-register original
             if self.config.HOTKEY_COMBINATION and self.window_manager:
-                self.hotkey_manager.register_delayed(self.window_manager.toggle_window)
+                self.hotkey_manager.register(self.window_manager.toggle_window)
             return
 
         # Update config
@@ -429,7 +441,7 @@ class WritingAssistantFletApp:
         if new_hotkey:
             self.log.info(f"Hotkey changed: {old_hotkey} -> {new_hotkey}")
             if self.window_manager:
-                self.hotkey_manager.register_delayed(self.window_manager.toggle_window)
+                self.hotkey_manager.register(self.window_manager.toggle_window)
         else:
             self.log.info(f"Hotkey disabled (was: {old_hotkey})")
             # Already unregistered when dialog opened, no need to unregister again
@@ -2,12 +2,44 @@
 
 from __future__ import annotations
 
-from src.ui.dialogs.hotkey_dialog import HotkeyDialogResult, show_hotkey_capture_dialog
-from src.ui.dialogs.update_dialog import (
-    show_no_update_dialog,
-    show_update_dialog,
-    show_update_error_dialog,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .hotkey_dialog import HotkeyDialogResult, show_hotkey_capture_dialog
+    from .update_dialog import (
+        show_no_update_dialog,
+        show_update_dialog,
+        show_update_error_dialog,
+    )
+
+# Public name -> submodule defining it. Submodules are imported on first
+# access (PEP 562): the app imports the hotkey dialog at startup, the update
+# dialogs are only loaded when an update check runs.
+_LAZY_EXPORTS = {
+    "show_update_dialog": ".update_dialog",
+    "show_no_update_dialog": ".update_dialog",
+    "show_update_error_dialog": ".update_dialog",
+    "show_hotkey_capture_dialog": ".hotkey_dialog",
+    "HotkeyDialogResult": ".hotkey_dialog",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazy exports alongside the already loaded names"""
+    return sorted([*globals(), *_LAZY_EXPORTS])
+
 
 __all__ = [
     "show_update_dialog",
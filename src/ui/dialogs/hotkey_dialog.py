@@ -6,9 +6,6 @@ Modal dialog for capturing and editing keyboard shortcuts
 
 from __future__ import annotations
 
-import os
-import subprocess
-import sys
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
@@ -21,20 +18,14 @@ from src.core.services.hotkey_capture import (
     HotkeyCapture,
     format_hotkey_for_display,
 )
+from src.core.utils.console import fix_console_encoding
 from src.ui.design_system import AppColors
 
 if TYPE_CHECKING:
     from src.core.managers.hotkey import HotkeyManager
 
 # Fix for Windows console encoding (emojis)
-os.environ["PYTHONIOENCODING"] = "utf-8"
-if os.name == "nt":
-    subprocess.run(["chcp", "65001"], shell=True, capture_output=True)
-try:
-    sys.stdout.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-    sys.stderr.reconfigure(encoding="utf-8")  # type: ignore[attr-defined]
-except AttributeError:
-    pass
+fix_console_encoding()
 
 
 class HotkeyDialogResult:
@@ -55,7 +55,7 @@ def show_update_dialog(page: ft.Page, update_info: dict, dark_mode: bool = True)
         logger.info(f"Update dialog shown for version {version}")
 
     except Exception as e:
-        logger.error(f"Failed to show update dialog: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to show update dialog: {}", e)
 
 
 def show_no_update_dialog(page: ft.Page, dark_mode: bool = True) -> None:
@@ -92,7 +92,7 @@ def show_no_update_dialog(page: ft.Page, dark_mode: bool = True) -> None:
         logger.info("No update dialog shown")
 
     except Exception as e:
-        logger.error(f"Failed to show no update dialog: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to show no update dialog: {}", e)
 
 
 def show_update_error_dialog(page: ft.Page, error: str, dark_mode: bool = True) -> None:
@@ -130,4 +130,4 @@ def show_update_error_dialog(page: ft.Page, error: str, dark_mode: bool = True)
         logger.info(f"Error dialog shown: {error}")
 
     except Exception as e:
-        logger.error(f"Failed to show error dialog: {e}", exc_info=True)
+        logger.opt(exception=True).error("Failed to show error dialog: {}", e)
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+# Build scripts import their helpers as top-level modules (run as scripts)
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "dev_build"))
+
+import build_dev  # noqa: E402
+import build_final  # noqa: E402
+
+ICON_PATH = Path("src/core/config/icons/app_icon.png")
+
+
+def test_pyinstaller_args():
+    """Test that builds are incremental unless a clean build is requested."""
+    dev_command = build_dev.get_pyinstaller_command(ICON_PATH)
+    final_command = build_final.get_pyinstaller_command(ICON_PATH)
+
+    for command in (dev_command, final_command):
+        assert "--clean" not in command
+        assert "--noconfirm" in command
+    assert final_command[-1] == "main.py"
+
+    # The dev build reuses its spec; build options follow the "--" separator
+    spec_index = dev_command.index("--") - 1
+    assert dev_command[spec_index] == str(build_dev.DEV_SPEC_FILE)
+    assert build_dev.DEV_SPEC_FILE.is_file()
+
+    assert "--clean" in build_dev.get_pyinstaller_command(ICON_PATH, clean_build=True)
+    assert "--clean" in build_final.get_pyinstaller_command(ICON_PATH, full_clean=True)
@@ -1,4 +1,5 @@
-from src.core.config.manager import ConfigManager
+from src.core.config import manager
+from src.core.config.manager import ConfigManager, parse_arguments
 
 
 def test_config_defaults(temp_config_file):
@@ -16,6 +17,7 @@ def test_config_persistence(temp_config_file):
     # 1. Create config and change a value
     config1 = ConfigManager(config_file=str(temp_config_file))
     config1.DARK_MODE = True
+    config1.flush()
 
     # 2. Create a new instance pointing to the same file
     config2 = ConfigManager(config_file=str(temp_config_file))
@@ -35,3 +37,78 @@ def test_config_attribute_access(temp_config_file):
     # Test setting
     config.DEBUG = True
     assert config.get("debug") is True
+
+    # Lowercase names update the configuration too (no instance attribute)
+    config.debug = False
+    assert config.DEBUG is False
+    assert "debug" not in vars(config)
+
+
+def test_config_migrates_old_defaults(temp_config_file):
+    """Test that an outdated default kept by a saved config is replaced."""
+    temp_config_file.write_text('{"min_trigger_interval": 0.5, "language": "en"}')
+
+    config = ConfigManager(config_file=str(temp_config_file))
+    assert config.MIN_TRIGGER_INTERVAL == 0.05
+    assert config.LANGUAGE == "en"
+
+    # The migrated value is written back
+    assert ConfigManager(config_file=str(temp_config_file)).MIN_TRIGGER_INTERVAL == 0.05
+
+
+def test_config_save_is_debounced(temp_config_file, monkeypatch):
+    """Test that a burst of changes is written once."""
+    config = ConfigManager(config_file=str(temp_config_file))
+    writes = []
+    monkeypatch.setattr(manager, "save_json_file", lambda path, data: writes.append(dict(data)))
+
+    # 1. Several assignments schedule a single pending save
+    config.DARK_MODE = False
+    config.LANGUAGE = "en"
+    config.DEBUG = True
+    assert writes == []
+    save_thread = config._save_thread
+    config.DEBUG = True
+    assert config._save_thread is save_thread  # One thread for the burst
+
+    # 2. flush() writes the latest values once, then nothing is pending
+    config.flush()
+    config.flush()
+    assert len(writes) == 1
+    assert writes[0]["language"] == "en"
+    assert writes[0]["debug"] is True
+
+
+def test_parse_arguments():
+    """Test the command line scan for --debug and --log-file."""
+    args = parse_arguments([])
+    assert args.debug is False
+    assert args.log_file is None
+
+    args = parse_arguments(["--debug", "--log-file", "run.log", "--flet-extra"])
+    assert args.debug is True
+    assert args.log_file == "run.log"
+
+    assert parse_arguments(["--log-file=other.log"]).log_file == "other.log"
+    assert parse_arguments(["--log-file"]).log_file is None
+
+
+def test_config_debounced_save_writes_once(temp_config_file, monkeypatch):
+    """Test that the save thread writes a burst once, then stops."""
+    monkeypatch.setattr(manager, "SAVE_DEBOUNCE_DELAY", 0.01)
+    config = ConfigManager(config_file=str(temp_config_file))
+    writes = []
+    monkeypatch.setattr(manager, "save_json_file", lambda path, data: writes.append(data))
+
+    config.LANGUAGE = "en"
+    config.DEBUG = True
+    save_thread = config._save_thread
+    save_thread.join(timeout=1.0)
+
+    # The written snapshot is a copy: later changes do not alter it
+    assert not save_thread.is_alive()
+    assert config._save_thread is None
+    assert len(writes) == 1
+    config.LANGUAGE = "fr"
+    assert writes[0]["language"] == "en"
+    config.flush()
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from src.core.managers import hotkey
+
+
+class FakeListener:
+    """Native listener whose registration succeeds or times out."""
+
+    def __init__(self, started):
+        self.started = started
+        self.stopped = False
+
+    def start(self):
+        return self.started
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_hotkey_registrations_are_released(monkeypatch):
+    """Test that native and keyboard registrations never stay active together."""
+    hooks = set()
+    monkeypatch.setattr(hotkey.keyboard, "unhook_all", hooks.clear)
+    monkeypatch.setattr(hotkey.keyboard, "add_hotkey", lambda key, *args, **kwargs: hooks.add(key))
+    monkeypatch.setattr(hotkey.keyboard, "remove_hotkey", hooks.remove)
+    listeners = []
+
+    def create_listener(key, callback):
+        listeners.append(FakeListener(started=len(listeners) > 0))
+        return listeners[-1]
+
+    monkeypatch.setattr(hotkey, "create_native_listener", create_listener)
+    config = SimpleNamespace(HOTKEY_COMBINATION="ctrl+space", MIN_TRIGGER_INTERVAL=0.05)
+    manager = hotkey.HotkeyManager(config)
+
+    # 1. A failed native start is stopped before falling back to keyboard hooks
+    assert manager.register(lambda: None)
+    assert listeners[0].stopped
+    assert hooks == {"ctrl+space"}
+
+    # 2. Registering natively again removes the keyboard hook
+    assert manager.register(lambda: None)
+    assert hooks == set()
+    assert not listeners[1].stopped
+
+    # 3. Unregister releases the native listener, then nothing is left
+    assert manager.unregister() is True
+    assert listeners[1].stopped
+    assert manager.unregister() is False
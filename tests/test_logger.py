@@ -0,0 +1,17 @@
+from loguru import logger
+
+from src.core.services import logger as logger_service
+from src.core.services.logger import setup_root_logger
+
+
+def test_setup_root_logger_is_idempotent(tmp_path, monkeypatch):
+    """Test that a repeated setup does not install duplicate handlers."""
+    monkeypatch.setattr(logger_service, "_root_logger_config", None)
+    log_path = tmp_path / "app.log"
+
+    setup_root_logger(debug=True, log_filename=str(log_path))
+    setup_root_logger(debug=True, log_filename=str(log_path))
+    logger.debug("single line")
+    logger.remove()
+
+    assert log_path.read_text(encoding="utf-8").count("single line") == 1
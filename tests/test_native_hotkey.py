@@ -0,0 +1,131 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.services.native_hotkey import (
+    MOD_ALT,
+    MOD_CONTROL,
+    X11_CONTROL_MASK,
+    X11_KEY_PRESS,
+    X11_KEY_RELEASE,
+    X11_SHIFT_MASK,
+    X11HotkeyListener,
+    parse_win32_hotkey,
+    parse_x11_hotkey,
+)
+
+GRABBED_KEYCODE = 65
+X11_MAPPING_NOTIFY = 34
+
+
+class FakeDisplay:
+    """Display connection replaying queued events (readable through a pipe)."""
+
+    events: list = []
+
+    def __init__(self):
+        self._read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"\0")
+        os.close(write_fd)
+        self.root = SimpleNamespace(
+            grab_key=lambda *args, **kwargs: None, ungrab_key=lambda *args: None
+        )
+
+    def screen(self):
+        return SimpleNamespace(root=self.root)
+
+    def keysym_to_keycode(self, keysym):
+        return GRABBED_KEYCODE
+
+    def sync(self):
+        pass
+
+    def fileno(self):
+        return self._read_fd
+
+    def pending_events(self):
+        # Queued events are delivered once, then select() waits for stop()
+        os.close(self._read_fd)
+        self._read_fd, _ = os.pipe()
+        return len(self.events)
+
+    def next_event(self):
+        return self.events.pop(0)
+
+    def close(self):
+        os.close(self._read_fd)
+
+
+def test_parse_native_hotkeys():
+    """Test the conversion of storage format hotkeys for the native backends."""
+    # 1. Win32: modifier flags and virtual-key code
+    assert parse_win32_hotkey("ctrl+alt+space") == (MOD_CONTROL | MOD_ALT, 0x20)
+    assert parse_win32_hotkey("ctrl+k") == (MOD_CONTROL, ord("K"))
+
+    # 2. X11: modifier mask and keysym name
+    assert parse_x11_hotkey("ctrl+space") == (X11_CONTROL_MASK, "space")
+    assert parse_x11_hotkey("shift+f5") == (X11_SHIFT_MASK, "F5")
+    assert parse_x11_hotkey("ctrl+k") == (X11_CONTROL_MASK, "k")
+
+    # 3. Unsupported hotkeys fall back to the keyboard library
+    for hotkey in ("ctrl+a+b", "ctrl", "ctrl+unknownkey"):
+        assert parse_win32_hotkey(hotkey) is None
+        assert parse_x11_hotkey(hotkey) is None
+
+
+def test_x11_listener_skips_non_key_events(monkeypatch):
+    """Test that the X11 listener survives non-key events and key repeat."""
+    display_module = pytest.importorskip("Xlib.display")
+
+    def key(event_type, time, detail=GRABBED_KEYCODE):
+        return SimpleNamespace(type=event_type, detail=detail, time=time)
+
+    # 1. A layout change (MappingNotify has no keycode), another key, then
+    # a press, its auto-repeat, the release and a new press
+    FakeDisplay.events = [
+        SimpleNamespace(type=X11_MAPPING_NOTIFY),
+        key(X11_KEY_PRESS, 1, detail=GRABBED_KEYCODE + 1),
+        key(X11_KEY_PRESS, 2),
+        key(X11_KEY_PRESS, 3),
+        key(X11_KEY_RELEASE, 4),
+        key(X11_KEY_PRESS, 5),
+    ]
+    monkeypatch.setattr(display_module, "Display", FakeDisplay)
+    calls = []
+    listener = X11HotkeyListener(X11_CONTROL_MASK, "space", lambda: calls.append(1))
+
+    # 2. The thread dispatches the two real presses and keeps running
+    assert listener.start() is True
+    thread = listener._thread
+    for _ in range(100):
+        if not FakeDisplay.events:
+            break
+        thread.join(0.01)
+    assert FakeDisplay.events == []
+    assert thread.is_alive()
+    listener.stop()
+    assert len(calls) == 2
+    assert not thread.is_alive()
+
+
+def test_x11_listener_ignores_non_press_events(monkeypatch):
+    """Test that releases and non-key events never run the callback."""
+    display_module = pytest.importorskip("Xlib.display")
+    FakeDisplay.events = [
+        SimpleNamespace(type=X11_KEY_RELEASE, detail=GRABBED_KEYCODE, time=1),
+        SimpleNamespace(type=X11_MAPPING_NOTIFY),
+    ]
+    monkeypatch.setattr(display_module, "Display", FakeDisplay)
+    calls = []
+    listener = X11HotkeyListener(X11_CONTROL_MASK, "space", lambda: calls.append(1))
+
+    assert listener.start() is True
+    thread = listener._thread
+    for _ in range(100):
+        if not FakeDisplay.events:
+            break
+        thread.join(0.01)
+    listener.stop()
+    assert FakeDisplay.events == []
+    assert calls == []
@@ -0,0 +1,36 @@
+from src.core.services import translation
+from src.core.services.translation import LanguageManager
+
+
+def test_mo_catalog_cache(tmp_path, monkeypatch):
+    """Test that the parsed MO catalog is cached and reused."""
+    monkeypatch.setattr(translation, "get_cache_dir", lambda: tmp_path)
+
+    # 1. First load parses the MO file and writes the cache
+    manager1 = LanguageManager(default_language="fr", available_languages=["en", "fr"])
+    cached_files = list((tmp_path / "translations").glob("*.pkl"))
+    assert len(cached_files) == 1
+
+    # 2. Second load is served from the cache, without parsing the MO file
+    def fail_parse(self, fp):
+        raise AssertionError("MO file parsed despite the cache")
+
+    monkeypatch.setattr(translation.CachedTranslations, "_parse", fail_parse)
+    manager2 = LanguageManager(default_language="fr", available_languages=["en", "fr"])
+
+    # 3. Both return the same translations
+    assert manager1._("Settings") == "Paramètres"
+    assert manager2._("Settings") == "Paramètres"
+    assert manager2._("Unknown text") == "Unknown text"
+
+
+def test_lookup_cache_follows_language(tmp_path, monkeypatch):
+    """Test that cached lookups are invalidated when the language changes."""
+    monkeypatch.setattr(translation, "get_cache_dir", lambda: tmp_path)
+
+    manager = LanguageManager(default_language="fr", available_languages=["en", "fr"])
+    assert manager._("Settings") == "Paramètres"
+    assert manager._("Settings") == "Paramètres"
+
+    manager.set_language("en")
+    assert manager._("Settings") == "Settings"